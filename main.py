@@ -2,49 +2,61 @@
 
 import sys
 import os
+import errno
+import functools
+import importlib
+import itertools
+import queue
 import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 # 全局图标管理器
 _global_icon_image = None  # 存储PIL Image对象
 _icon_preloaded = False
+_icon_preload_started = False  # 后台解码线程是否已启动
+_icon_ready = threading.Event()  # 后台解码结束（无论成功与否）时置位
+_icon_path_cache = None  # 图标路径缓存，空字符串表示未找到
+_log_dir_cache = None  # 日志目录缓存
 
 def preload_icon():
-    """预加载图标，确保在窗口创建前就可用了"""
-    global _icon_preloaded, _global_icon_image
+    """在后台线程中预加载图标，确保在窗口创建前就可用了"""
+    global _icon_preload_started
     
-    if not _icon_preloaded:
-        try:
-            # 确保PIL模块可用
-            if 'PIL_Image' not in globals() or 'PIL_ImageTk' not in globals():
-                from PIL import Image as PIL_Image
-                from PIL import ImageTk as PIL_ImageTk
-                # 将其注入全局命名空间以便其他函数使用
-                globals()['PIL_Image'] = PIL_Image
-                globals()['PIL_ImageTk'] = PIL_ImageTk
-            
-            icon_path = get_icon_path()
-            if icon_path and 'PIL_Image' in globals():
-                # 只加载Image对象，不创建PhotoImage，因为PhotoImage依赖于特定的Tk实例
-                _global_icon_image = PIL_Image.open(icon_path)
-                _icon_preloaded = True
-                print(f"图标图像预加载成功: {icon_path}")
-                return True
-        except Exception as e:
-            print(f"图标预加载失败: {e}")
-            _icon_preloaded = False
+    if not _icon_preload_started:
+        _icon_preload_started = True
+        threading.Thread(target=_load_icon_image, daemon=True).start()
     
     return _icon_preloaded is True
 
-def get_global_icon_image():
-    """获取全局图标Image对象"""
-    global _global_icon_image
+def _load_icon_image():
+    """解码图标图像（在后台线程中运行）"""
+    global _icon_preloaded, _global_icon_image
     
-    if _global_icon_image is None:
-        preload_icon()
+    try:
+        icon_path = get_icon_path()
+        if icon_path:
+            # 只加载Image对象，不创建PhotoImage，因为PhotoImage依赖于特定的Tk实例
+            icon_image = PIL_Image.open(icon_path)
+            icon_image.load()  # Image.open是惰性的，在此完成PNG解码
+            _global_icon_image = icon_image
+            _icon_preloaded = True
+            print(f"图标图像预加载成功: {icon_path}")
+    except Exception as e:
+        print(f"图标预加载失败: {e}")
+        _icon_preloaded = False
+    finally:
+        _icon_ready.set()
+
+def get_global_icon_image():
+    """获取全局图标Image对象，必要时短暂等待后台解码完成"""
+    preload_icon()
+    _icon_ready.wait(timeout=1.0)
     
     return _global_icon_image
 
@@ -53,7 +65,17 @@ def get_global_icon_photo():
     return None
 
 def get_icon_path():
-    """获取图标文件的完整路径"""
+    """获取图标文件的完整路径（结果缓存，只探测一次文件系统）"""
+    global _icon_path_cache
+    
+    if _icon_path_cache is not None:
+        return _icon_path_cache or None
+    
+    _icon_path_cache = _find_icon_path() or ""
+    return _icon_path_cache or None
+
+def _find_icon_path():
+    """在候选位置中查找图标文件"""
     # 检查当前目录（源码运行）
     if os.path.exists('appicon.png'):
         return 'appicon.png'
@@ -74,7 +96,12 @@ def get_icon_path():
     return None
 
 def get_log_directory():
-    """获取跨平台的日志目录路径"""
+    """获取跨平台的日志目录路径（首次调用时确定并创建，之后直接返回）"""
+    global _log_dir_cache
+    
+    if _log_dir_cache:
+        return _log_dir_cache
+    
     system = sys.platform
     
     if system == "darwin":  # macOS
@@ -95,38 +122,60 @@ def get_log_directory():
         log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
         os.makedirs(log_dir, exist_ok=True)
     
+    _log_dir_cache = log_dir
     return log_dir
 
 # 延迟导入 - 提高启动速度
-def import_heavy_modules():
-    """延迟导入重量级的模块"""
-    global tk, ttk, tb, filedialog, messagebox, shutil, hashlib, psutil, json, subprocess, PIL_Image, PIL_ImageTk
-    
-    import tkinter as tk
-    from tkinter import ttk, filedialog, messagebox
-    from tkinter.constants import BOTH, YES, NO, X, Y, LEFT, RIGHT, TOP, BOTTOM, W, E, N, S, CENTER, HORIZONTAL, VERTICAL
-    import shutil
-    import hashlib
-    import json
-    import subprocess
-    
-    # 这些模块较重，延迟导入
-    try:
-        import ttkbootstrap as tb
-        from ttkbootstrap.constants import PRIMARY, SUCCESS, INFO, WARNING, DANGER
-    except ImportError:
-        tb = None
-    
-    try:
-        import psutil
-    except ImportError:
-        psutil = None
+# 名称 -> 模块路径，首次访问时才真正导入
+_lazy_modules = {
+    "tk": "tkinter",
+    "ttk": "tkinter.ttk",
+    "filedialog": "tkinter.filedialog",
+    "messagebox": "tkinter.messagebox",
+    "tb": "ttkbootstrap",
+    "PIL_Image": "PIL.Image",
+    "PIL_ImageTk": "PIL.ImageTk",
+    "psutil": "psutil",
+    "shutil": "shutil",
+    "hashlib": "hashlib",
+    "json": "json",
+    "subprocess": "subprocess",
+    "ctypes": "ctypes",
+    "md5_verifier": "md5_verifier",
+}
+
+def __getattr__(name):
+    """按需导入重量级模块（PEP 562），导入后写回模块全局变量"""
+    if name not in _lazy_modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_lazy_modules[name])
+    globals()[name] = module
+    return module
+
+class _LazyModule:
+    """模块占位符 - 首次访问属性时导入真实模块并替换自身"""
+    def __init__(self, name):
+        self._name = name
     
+    def __getattr__(self, attr):
+        return getattr(__getattr__(self._name), attr)
+
+# 模块内部代码直接按名称引用（不经过模块级__getattr__），因此先放入占位符
+for _name in _lazy_modules:
+    globals()[_name] = _LazyModule(_name)
+del _name
+
+def optional_module(name):
+    """获取可选的重量级模块，不可用时返回None"""
     try:
-        from PIL import Image as PIL_Image, ImageTk as PIL_ImageTk
+        return __getattr__(name)
     except ImportError:
-        PIL_Image = None
-        PIL_ImageTk = None
+        return None
+
+def prewarm_heavy_modules():
+    """在后台线程中预先导入重量级模块，与启动窗口动画重叠"""
+    for name in ("tb", "PIL_ImageTk", "psutil"):
+        optional_module(name)
 
 # 快速依赖检查（只检查关键模块）
 def quick_check_dependencies():
@@ -156,13 +205,8 @@ def quick_check_dependencies():
 def full_check_dependencies():
     """完整的依赖检查"""
     required_modules = ["ttkbootstrap", "psutil", "PIL"]
-    missing_modules = []
-    
-    for module_name in required_modules:
-        try:
-            __import__(module_name)
-        except ImportError:
-            missing_modules.append(module_name)
+    # 只查找模块规格而不执行模块代码，避免为检查而提前导入重量级模块
+    missing_modules = [m for m in required_modules if find_spec(m) is None]
     
     if missing_modules:
         if getattr(sys, 'frozen', False):
@@ -172,7 +216,159 @@ def full_check_dependencies():
     
     return True, None
 
+# 文件大小单位，下标为以1024为底的级别
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 实时进度中的字节数几乎不会重复，缓存命中率很低，format_size不做缓存
+def format_size(size_bytes) -> str:
+    """格式化文件大小显示"""
+    if size_bytes == 0:
+        return "0 B"
+    if size_bytes < 0:
+        # 与原先的循环一致：负数不换算单位
+        return f"{float(size_bytes):.1f} B"
+    
+    # 由二进制位数直接得出单位级别（每级1024=2^10），无需循环除法
+    i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
+
+# 以下格式化函数的输入是整秒数，进度界面以固定频率反复格式化相同的值，因此缓存结果
+@functools.lru_cache(maxsize=1024)
+def format_duration(seconds: int) -> str:
+    """格式化时长显示（X小时X分X秒），seconds为非负整数"""
+    if seconds < 60:
+        return f"{seconds}秒"
+    elif seconds < 3600:
+        minutes = seconds // 60
+        secs = seconds % 60
+        return f"{minutes}分{secs}秒"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        secs = seconds % 60
+        return f"{hours}小时{minutes}分{secs}秒"
+
+@functools.lru_cache(maxsize=1024)
+def format_clock(seconds: int) -> str:
+    """格式化时钟式时间显示（MM:SS 或 HH:MM:SS），seconds为非负整数"""
+    minutes = seconds // 60
+    secs = seconds % 60
+    
+    if minutes >= 60:
+        hours = minutes // 60
+        minutes = minutes % 60
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes:02d}:{secs:02d}"
+
+def _relative_prefix_length(base_path: str) -> int:
+    """扫描清单中base_path下的路径去掉该长度的前缀即为相对路径（os.scandir以单个分隔符拼接路径）"""
+    if base_path.endswith(("/", os.sep)):
+        return len(base_path)
+    return len(base_path) + 1
+
+def _file_extension(file_name: str) -> str:
+    """取文件名的小写扩展名（含点号），没有扩展名时返回空字符串"""
+    # 直接定位最后一个点号，避免splitext的元组分配；以点号开头的隐藏文件视为无扩展名
+    dot = file_name.rfind(".")
+    if dot <= 0:
+        return ""
+    return file_name[dot:].lower()
+
+# 拷贝块大小阶梯：(文件大小下限, 块大小)，按从大到小的顺序匹配
+_COPY_CHUNK_SIZES = (
+    (2 * 1024 * 1024 * 1024, 32 * 1024 * 1024),  # 大于2GB：32MB块
+    (500 * 1024 * 1024, 16 * 1024 * 1024),       # 大于500MB：16MB块
+    (100 * 1024 * 1024, 8 * 1024 * 1024),        # 大于100MB：8MB块
+    (10 * 1024 * 1024, 4 * 1024 * 1024),         # 大于10MB：4MB块
+)
+_BASE_COPY_CHUNK_SIZE = 1024 * 1024  # 其余文件：1MB块
+
+def _copy_chunk_size(file_size: int) -> int:
+    """按文件大小选择拷贝块大小"""
+    for min_size, chunk_size in _COPY_CHUNK_SIZES:
+        if file_size > min_size:
+            return chunk_size
+    return _BASE_COPY_CHUNK_SIZE
+
+_FALLOC_FL_KEEP_SIZE = 0x01
+_fallocate = None  # 首次预分配时加载，False表示当前平台不可用
+
+def _preallocate(fd: int, length: int):
+    """为目标文件预留磁盘空间（仅Linux），写入时文件系统无需反复扩展区段"""
+    global _fallocate
+    if _fallocate is None:
+        _fallocate = False
+        # 直接调用fallocate而非os.posix_fallocate：后者在不支持的文件系统（如FAT32）上会逐块写零模拟
+        if sys.platform.startswith("linux"):
+            try:
+                func = ctypes.CDLL(None, use_errno=True).fallocate64
+                func.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+                func.restype = ctypes.c_int
+                _fallocate = func
+            except (OSError, AttributeError):
+                pass
+    if _fallocate:
+        # 保持文件大小不变，中途停止时不会留下大小看似完整的文件；文件系统不支持时返回错误，忽略即可
+        _fallocate(fd, _FALLOC_FL_KEEP_SIZE, 0, length)
+
+# Windows和macOS没有posix_fadvise，相关提示在这些平台上直接跳过
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_PREFETCH_LIMIT = 32 * 1024 * 1024  # 预读即将拷贝的文件时最多提示的字节数
+
+def _advise_sequential_read(fd: int, length: int):
+    """提示内核将按顺序完整读取文件，加大预读窗口并提前开始读取"""
+    if not _HAS_FADVISE:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+# macOS没有fdatasync，改用fsync；Windows上fsync即FlushFileBuffers
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+# 达到该大小的目标文件写完后先落盘再交给验证。每次落盘都要等待介质确认，在Windows和USB读卡器上尤其慢，
+# 对大量小文件（缩略图、元数据等）逐个落盘会拖慢拷贝，因此小文件只提示释放页缓存：
+# 其验证可能读到尚未回写的缓存，但这些文件在总数据量中占比很小
+_SYNC_MIN_SIZE = _BASE_COPY_CHUNK_SIZE
+
+def _sync_written_file(fd: int, length: int):
+    """把较大的目标文件刷到存储介质并释放其页缓存，之后的验证读取的是介质上的数据而不是刚写入的缓存"""
+    # DONTNEED不会丢弃仍是脏页或正在回写的页，必须先落盘
+    if length >= _SYNC_MIN_SIZE:
+        _fdatasync(fd)
+    _advise_drop_cache(fd)
+
+def _advise_drop_cache(fd: int):
+    """提示内核该文件的页缓存不再需要，写回后即可释放"""
+    if not _HAS_FADVISE:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+def _prefetch_file(file_path: str, length: int):
+    """让内核在后台预读即将拷贝的文件开头部分"""
+    if not _HAS_FADVISE:
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, min(length, _PREFETCH_LIMIT), os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 class Tooltip:
+    # 所有提示共用一个隐藏的Toplevel，悬停时只更新文字和位置，不再反复创建/销毁
+    _shared_tip = None
+    _shared_label = None
+    
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
@@ -180,16 +376,26 @@ class Tooltip:
         widget.bind("<Enter>", self.show)
         widget.bind("<Leave>", self.hide)
         widget.bind("<Motion>", self.move)
+    @classmethod
+    def _get_shared_tip(cls, widget):
+        # 首次使用或所属窗口已销毁时才创建，样式只在此处设置一次
+        if cls._shared_tip is None or not cls._shared_tip.winfo_exists():
+            tip = tk.Toplevel(widget.winfo_toplevel())
+            tip.wm_overrideredirect(True)
+            tip.withdraw()
+            cls._shared_label = tk.Label(tip, justify="left", relief="solid", borderwidth=1, background="#ffffe0", foreground="#333", font=("Arial", 10))
+            cls._shared_label.pack(padx=8, pady=6)
+            cls._shared_tip = tip
+        return cls._shared_tip
     def show(self, event=None):
         if self.tip or not self.text:
             return
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 10
-        self.tip = tk.Toplevel(self.widget)
-        self.tip.wm_overrideredirect(True)
+        self.tip = self._get_shared_tip(self.widget)
+        self._shared_label.config(text=self.text)
         self.tip.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(self.tip, text=self.text, justify="left", relief="solid", borderwidth=1, background="#ffffe0", foreground="#333", font=("Arial", 10))
-        label.pack(padx=8, pady=6)
+        self.tip.deiconify()
     def move(self, event):
         if self.tip:
             x = event.x_root + 12
@@ -197,7 +403,7 @@ class Tooltip:
             self.tip.wm_geometry(f"+{x}+{y}")
     def hide(self, event=None):
         if self.tip:
-            self.tip.destroy()
+            self.tip.withdraw()
             self.tip = None
 
 class CopyManager:
@@ -214,6 +420,11 @@ class CopyManager:
         # 日志文件相关
         self.log_file = None
         self.log_buffer = []  # 日志缓冲区
+        self.log_buffer_size = 0  # 缓冲区中的字符数
+        self.log_buffer_max = 65536  # 缓冲区达到该大小时写入文件
+        self._log_lock = threading.Lock()  # 拷贝线程写入与UI线程定时刷新共用
+        self._last_ts_sec = 0  # 上次格式化时间戳对应的整秒
+        self._last_ts_str = ""  # 同一秒内复用的时间戳字符串
         
         # 拷贝进度相关
         self.total_size = 0  # 总大小（字节）
@@ -221,6 +432,8 @@ class CopyManager:
         self.copy_start_time = 0  # 拷贝开始时间
         self.copy_speed = 0  # 拷贝速度（字节/秒）
         self.copy_eta = 0  # 预计剩余时间（秒）
+        self.partial_size = 0  # 正在拷贝的文件中已写入的字节数
+        self.progress_lock = threading.Lock()  # 多个拷贝线程更新进度计数时使用
         
         # 验证进度相关
         self.verified_size = 0  # 已验证大小（字节）
@@ -237,10 +450,11 @@ class CopyManager:
         self.md5_calc_size = 0  # 已计算MD5的数据量（字节）
         self.md5_calc_speed = 0  # MD5计算速度（字节/秒）
         self.md5_start_time = 0  # MD5验证开始时间
+        self.source_hashes = {}  # 拷贝时顺带计算的源文件MD5（目标路径 -> 哈希值）
         
-        # 性能优化：缓存文件大小计算结果
-        self._size_cache = {}
-        self._size_cache_timeout = 5  # 缓存超时时间（秒）
+        # 性能优化：缓存扫描结果，供同一次拷贝中的拷贝和验证阶段复用（拷贝前总是重新扫描）
+        self._scan_cache = OrderedDict()
+        self._scan_cache_max = 128  # 超出后淘汰最久未使用的条目
         
         # 备用拷贝进度相关
         self.backup_total_files = 0
@@ -253,73 +467,100 @@ class CopyManager:
         self.backup_results = []
     
     def get_folder_size(self, folder_path: str) -> int:
-        """计算文件夹总大小（字节）- 使用缓存优化"""
-        # 检查缓存
-        current_time = time.time()
+        """计算文件夹总大小（字节）"""
+        # 总是重新扫描：子目录的变化不会改变顶层文件夹的修改时间，FAT/exFAT卡的根目录也没有可靠的修改时间，
+        # 同一挂载点换卡后缓存会给出上一张卡的大小
+        return self.scan_tree(folder_path, refresh=True)[0]
+    
+    def scan_tree(self, folder_path: str, refresh: bool = False) -> Tuple[int, List[Tuple[str, int, str]], List[str]]:
+        """
+        一次遍历得到文件夹总大小、文件清单 [(文件路径, 大小, 小写扩展名), ...] 和子目录清单（父目录在前）
+        
+        refresh为False时直接返回上次扫描的结果，只用于同一次拷贝中复用拷贝前刚扫描的清单
+        """
         cache_key = folder_path
-        if cache_key in self._size_cache:
-            cached_size, cache_time = self._size_cache[cache_key]
-            if current_time - cache_time < self._size_cache_timeout:
-                return cached_size
+        if not refresh and cache_key in self._scan_cache:
+            self._scan_cache.move_to_end(cache_key)
+            return self._scan_cache[cache_key]
         
         total_size = 0
+        entries = []
+        subdirs = []
         try:
-            # 使用更快的文件遍历方法
-            for root, dirs, files in os.walk(folder_path, followlinks=False):
-                # 限制遍历深度，避免深层嵌套目录
-                if root.count(os.sep) - folder_path.count(os.sep) > 10:
-                    dirs[:] = []  # 不继续深入
-                    continue
-                    
-                for file in files:
-                    file_path = os.path.join(root, file)
+            with os.scandir(folder_path) as it:
+                for entry in it:
                     try:
-                        stat = os.lstat(file_path)  # 使用lstat避免符号链接
-                        total_size += stat.st_size
-                    except (OSError, PermissionError, FileNotFoundError):
-                        # 跳过无法访问的文件
+                        if entry.is_dir():
+                            # 与os.walk一致：不进入指向目录的符号链接
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            file_size = entry.stat(follow_symlinks=False).st_size
+                            entries.append((entry.path, file_size, _file_extension(entry.name)))
+                            total_size += file_size
+                    except OSError:
                         continue
-        except (OSError, PermissionError):
+        except OSError:
             # 跳过无法访问的文件夹
             pass
         
+        # 多个子目录时并行遍历，重叠各目录的readdir等待时间
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self._walk_subtree, subdirs))
+        else:
+            results = [self._walk_subtree(subdir) for subdir in subdirs]
+        dirs = list(subdirs)
+        for subtree_size, subtree_entries, subtree_dirs in results:
+            total_size += subtree_size
+            entries.extend(subtree_entries)
+            dirs.extend(subtree_dirs)
+        
         # 缓存结果
-        self._size_cache[cache_key] = (total_size, current_time)
-        return total_size
+        self._scan_cache[cache_key] = (total_size, entries, dirs)
+        self._scan_cache.move_to_end(cache_key)
+        if len(self._scan_cache) > self._scan_cache_max:
+            self._scan_cache.popitem(last=False)
+        return total_size, entries, dirs
+    
+    def _walk_subtree(self, subtree_path: str) -> Tuple[int, List[Tuple[str, int, str]], List[str]]:
+        """遍历子目录树，返回其总大小、文件清单和其下的子目录清单"""
+        total_size = 0
+        entries = []
+        dirs = []
+        # 使用os.scandir遍历，DirEntry.stat()复用readdir结果，省去逐文件lstat
+        stack = [subtree_path]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                # 清单要用于拷贝，必须完整，不限制遍历深度
+                                if not entry.is_symlink():
+                                    stack.append(entry.path)
+                                    dirs.append(entry.path)
+                            else:
+                                # 不跟随符号链接
+                                file_size = entry.stat(follow_symlinks=False).st_size
+                                entries.append((entry.path, file_size, _file_extension(entry.name)))
+                                total_size += file_size
+                        except OSError:
+                            # 跳过无法访问的文件
+                            continue
+            except OSError:
+                # 跳过无法访问的文件夹
+                continue
+        return total_size, entries, dirs
     
     def format_size(self, size_bytes: int) -> str:
         """格式化文件大小显示"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and i < len(size_names) - 1:
-            size /= 1024
-            i += 1
-        
-        return f"{size:.1f} {size_names[i]}"
+        return format_size(size_bytes)
     
     def format_time(self, seconds) -> str:
         """格式化时间显示"""
-        if seconds < 0:
-            seconds = 0
-        
-        seconds = int(seconds)  # 转换为整数
-        
-        if seconds < 60:
-            return f"{seconds}秒"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            secs = seconds % 60
-            return f"{minutes}分{secs}秒"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
-            return f"{hours}小时{minutes}分{secs}秒"
+        return format_duration(int(seconds) if seconds > 0 else 0)
     
     def init_log_file(self, log_dir: str, session_name: str):
         """初始化日志文件"""
@@ -332,7 +573,7 @@ class CopyManager:
             log_filename = f"copy_log_{timestamp}_{session_name}.log"
             log_path = os.path.join(log_dir, log_filename)
             
-            self.log_file = open(log_path, 'w', encoding='utf-8')
+            self.log_file = open(log_path, 'w', encoding='utf-8', buffering=65536)
             
             # 写入日志头
             self.log_file.write("="*80 + "\n")
@@ -348,67 +589,67 @@ class CopyManager:
             return None
     
     def write_log(self, message: str):
-        """写入日志到文件"""
+        """写入日志到缓冲区，缓冲区满或定时刷新时才写入文件"""
         if self.log_file:
-            try:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.log_file.write(f"[{timestamp}] {message}\n")
-                self.log_file.flush()
-            except Exception as e:
-                print(f"写入日志失败: {e}")
+            # 同一秒内的日志复用已格式化的时间戳，避免重复strftime
+            sec = int(time.time())
+            if sec != self._last_ts_sec:
+                self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                self._last_ts_sec = sec
+            line = f"[{self._last_ts_str}] {message}"
+            with self._log_lock:
+                self.log_buffer.append(line)
+                self.log_buffer_size += len(line) + 1
+                if self.log_buffer_size >= self.log_buffer_max:
+                    self._flush_log_buffer()
+    
+    def flush_log(self):
+        """将缓冲的日志写入文件（供UI线程定时调用）"""
+        with self._log_lock:
+            self._flush_log_buffer()
+    
+    def _flush_log_buffer(self):
+        """写出日志缓冲区，调用方需持有_log_lock"""
+        if not self.log_file or not self.log_buffer:
+            return
+        try:
+            # 一次拼接、一次写入，避免逐行write和字符串拼接
+            self.log_file.write("\n".join(self.log_buffer))
+            self.log_file.write("\n")
+            self.log_file.flush()
+        except Exception as e:
+            print(f"写入日志失败: {e}")
+        self.log_buffer.clear()
+        self.log_buffer_size = 0
     
     def close_log_file(self):
         """关闭日志文件 - 优化清理过程"""
-        if self.log_file:
-            try:
-                # 确保所有缓冲的日志都被写入
-                if self.log_buffer:
-                    for message in self.log_buffer:
-                        self.log_file.write(message + "\n")
-                    self.log_buffer.clear()
-                
-                self.log_file.write("\n" + "="*80 + "\n")
-                self.log_file.write(f"结束时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                self.log_file.write("="*80 + "\n")
-                self.log_file.flush()  # 确保数据写入磁盘
-                self.log_file.close()
-                self.log_file = None
-            except Exception as e:
-                print(f"关闭日志文件失败: {e}")
+        with self._log_lock:
+            if self.log_file:
+                try:
+                    # 确保所有缓冲的日志都被写入
+                    self._flush_log_buffer()
+                    
+                    self.log_file.write("\n" + "="*80 + "\n")
+                    self.log_file.write(f"结束时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    self.log_file.write("="*80 + "\n")
+                    self.log_file.flush()  # 确保数据写入磁盘
+                    self.log_file.close()
+                    self.log_file = None
+                except Exception as e:
+                    print(f"关闭日志文件失败: {e}")
         
         # 清理缓存
-        self._size_cache.clear()
+        self._scan_cache.clear()
 
 class StartupWindow:
     """启动窗口 - 显示加载进度"""
     def __init__(self):
-        # 确保tkinter已导入
-        if 'tk' not in globals():
-            import tkinter as tk
-            from tkinter import ttk
-        
-        # 确保PIL已导入
-        if 'PIL_Image' not in globals() or 'PIL_ImageTk' not in globals():
-            try:
-                from PIL import Image as PIL_Image, ImageTk as PIL_ImageTk
-            except ImportError:
-                pass
-        
         self.root = tk.Tk()
         self.root.title("CardCopyer-拷贝乐 - 启动中")
         self.root.geometry("300x150")
         self.root.resizable(False, False)
         
-        # 设置窗口图标
-        try:
-            icon_path = get_icon_path()
-            if icon_path and 'PIL_Image' in globals() and 'PIL_ImageTk' in globals():
-                icon_image = PIL_Image.open(icon_path)
-                icon_photo = PIL_ImageTk.PhotoImage(icon_image)
-                self.root.iconphoto(True, icon_photo)
-        except Exception:
-            pass  # 如果图标设置失败，继续使用默认图标
-        
         # 居中显示
         self.root.update_idletasks()
         x = (self.root.winfo_screenwidth() - 300) // 2
@@ -447,13 +688,57 @@ class StartupWindow:
         self.progress.pack(pady=10)
         self.progress.start()
         
+        self._last_update = 0.0  # 上次刷新界面的时间（time.monotonic）
+        
+        # 启动期间的轮询任务共用一个定时器，而不是各自反复注册after回调
+        self._tick_callbacks = []
+        self._tick_job = None
+        self._closed = False
+        
+        # 窗口图标等后台解码完成后再设置，PIL不在首次绘制的关键路径上
+        self.icon_photo = None
+        self.add_tick_callback(self.set_icon_when_ready)
+        
+    def add_tick_callback(self, callback):
+        """注册在启动窗口定时器中反复调用的任务，任务返回True表示已完成，不再调用"""
+        self._tick_callbacks.append(callback)
+        if self._tick_job is None:
+            self._tick_job = self.root.after(30, self._tick)
+        
+    def _tick(self):
+        """依次调用轮询任务，仍有未完成的任务时继续计时"""
+        for callback in list(self._tick_callbacks):
+            if callback():
+                self._tick_callbacks.remove(callback)
+            # 任务中可能已关闭启动窗口
+            if self._closed:
+                return
+        self._tick_job = self.root.after(30, self._tick) if self._tick_callbacks else None
+        
+    def set_icon_when_ready(self):
+        """图标预加载完成后设置窗口图标，返回是否已完成"""
+        if not _icon_ready.is_set():
+            return False
+        try:
+            if _global_icon_image is not None:
+                self.icon_photo = PIL_ImageTk.PhotoImage(_global_icon_image, master=self.root)
+                self.root.iconphoto(True, self.icon_photo)
+        except Exception:
+            pass  # 如果图标设置失败，继续使用默认图标
+        return True
+        
     def update_progress(self, message):
-        """更新进度信息"""
+        """更新进度信息 - 刷新频率限制在60Hz以内"""
         self.progress_label.config(text=message)
-        self.root.update()
+        now = time.monotonic()
+        if now - self._last_update > 0.016:
+            # 只处理重绘等空闲任务，不像update()那样泵送全部事件，避免重入
+            self.root.update_idletasks()
+            self._last_update = now
         
     def close(self):
         """关闭启动窗口"""
+        self._closed = True
         self.progress.stop()
         self.root.destroy()
 
@@ -462,11 +747,8 @@ class DITCopyTool:
     """CardCopyer主窗口"""
     
     def __init__(self):
-        # 导入重量级模块
-        import_heavy_modules()
-        
-        # 检查ttkbootstrap是否可用
-        if tb is None:
+        # 检查ttkbootstrap是否可用（首次访问时才真正导入）
+        if optional_module("tb") is None:
             self.show_error_and_exit("ttkbootstrap模块不可用", "请安装ttkbootstrap: pip install ttkbootstrap")
             return
         
@@ -491,7 +773,7 @@ class DITCopyTool:
         # 尝试立即设置图标（窗口隐藏状态下）
         try:
             icon_image = get_global_icon_image()
-            if icon_image and 'PIL_ImageTk' in globals():
+            if icon_image:
                 self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                 self.window.wm_iconphoto(True, self.icon_photo)
                 if hasattr(self.window, 'iconphoto'):
@@ -505,22 +787,30 @@ class DITCopyTool:
         
         self.copy_manager = CopyManager()
         self.source_items = []  # 源项目列表
+        self._total_size = 0  # 源项目总大小，随添加/移除增减，避免每次重新求和
         self.destination_path = ""
         self.copy_thread = None
-        self.media_extensions = {
+        self.copy_concurrency = 4  # 同时拷贝的文件数
+        self.debug = False  # 是否输出逐文件、逐目录的详细调试日志
+        self._pending_log = deque()  # 等待插入日志框的日志行（拷贝线程追加，主线程取出）
+        self.log_view_max_lines = 5000  # 日志框最多显示的行数
+        self._missing_parent_reports = {}  # 父目录 -> 已记录的缺失文件数
+        self.missing_parent_report_limit = 3  # 同一目录最多详细记录几次缺失文件
+        self._verify_queue = None  # 拷贝完成的文件经此队列交给验证线程
+        self._verify_threads = []
+        self.md5_verifier = None  # 验证期间使用的MD5校验器
+        self.md5_cache_limit = 1024  # 验证期间MD5校验器最多缓存的哈希条目数
+        self.verify_workers = 2  # 验证线程数（开始拷贝时按设置确定），hashlib计算时释放GIL，多个文件可同时哈希
+        self.media_extensions = frozenset({
             ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".heic", ".heif",
             ".cr2", ".cr3", ".nef", ".arw", ".dng", ".rw2", ".orf", ".raf", ".srw", ".pef", ".rwl",
             ".r3d", ".braw", ".ari", ".cine",
             ".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".m4v", ".webm", ".mxf", ".mts", ".m2ts", ".ts", ".3gp", ".3g2",
             ".mp3", ".wav", ".aac", ".flac", ".ogg", ".m4a", ".aiff", ".aif", ".wma"
-        }
+        })
         
         # 延迟UI初始化（窗口仍在隐藏状态）
         self.window.after(100, self._show_main_window_with_icon)
-        
-        # 启动图标监控定时器
-        if self.icon_photo:
-            self._start_icon_monitor()
     
     def _show_main_window_with_icon(self):
         """显示主窗口并确保图标正确设置"""
@@ -535,6 +825,9 @@ class DITCopyTool:
             self.window.deiconify()
             print("主窗口已显示")
             
+            # 窗口重新映射（如最小化后还原）时才重新应用图标，不再定时轮询
+            self.window.bind("<Map>", self._on_window_map)
+            
         except Exception as e:
             print(f"显示主窗口时发生异常: {e}")
             # 确保窗口显示，但不重复设置UI
@@ -547,12 +840,11 @@ class DITCopyTool:
             icon_image = get_global_icon_image()
             if icon_image:
                 # 为当前窗口创建专用的PhotoImage
-                if 'PIL_ImageTk' in globals():
-                    self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
-                    self.window.wm_iconphoto(True, self.icon_photo)
-                    if hasattr(self.window, 'iconphoto'):
-                        self.window.iconphoto(True, self.icon_photo)
-                    print("图标设置成功")
+                self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
+                self.window.wm_iconphoto(True, self.icon_photo)
+                if hasattr(self.window, 'iconphoto'):
+                    self.window.iconphoto(True, self.icon_photo)
+                print("图标设置成功")
         except Exception as e:
             print(f"设置图标失败: {e}")
     
@@ -564,51 +856,36 @@ class DITCopyTool:
             
             if icon_image and self.window:
                 # 为当前窗口创建专用的PhotoImage
-                if 'PIL_ImageTk' in globals():
-                    self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
-                    
-                    # 使用多种方法设置图标，确保兼容性
-                    self.window.wm_iconphoto(True, self.icon_photo)
-                    if hasattr(self.window, 'iconphoto'):
-                        self.window.iconphoto(True, self.icon_photo)
+                self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                     
-                    # 启动图标监控定时器
-                    self._start_icon_monitor()
+                # 使用多种方法设置图标，确保兼容性
+                self.window.wm_iconphoto(True, self.icon_photo)
+                if hasattr(self.window, 'iconphoto'):
+                    self.window.iconphoto(True, self.icon_photo)
             elif not icon_image:
                 # 如果全局图标不可用，尝试本地创建
                 icon_path = get_icon_path()
-                if icon_path and 'PIL_Image' in globals() and 'PIL_ImageTk' in globals():
+                if icon_path:
                     icon_image = PIL_Image.open(icon_path)
                     self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                     if self.window and self.icon_photo:
                         self.window.wm_iconphoto(True, self.icon_photo)
                         if hasattr(self.window, 'iconphoto'):
                             self.window.iconphoto(True, self.icon_photo)
-                        
-                        # 启动图标监控定时器
-                        self._start_icon_monitor()
         except Exception as e:
             print(f"设置主窗口图标失败: {e}")
             pass
     
-    def _start_icon_monitor(self):
-        """启动图标监控定时器，防止图标被系统重置"""
-        def check_and_restore_icon():
-            try:
-                # 检查图标是否仍然有效
-                if self.window and self.icon_photo:
-                    # 重新应用图标
-                    self.window.wm_iconphoto(True, self.icon_photo)
-                    if hasattr(self.window, 'iconphoto'):
-                        self.window.iconphoto(True, self.icon_photo)
-                
-                # 每5秒检查一次
-                self.window.after(5000, check_and_restore_icon)
-            except Exception:
-                pass
-        
-        # 启动第一次检查
-        self.window.after(5000, check_and_restore_icon)
+    def _on_window_map(self, event):
+        """主窗口被映射时重新应用图标，防止图标被系统重置"""
+        # 绑定在顶层窗口上的事件也会被子控件触发，只处理窗口本身
+        if event.widget is not self.window:
+            return
+        try:
+            if self.icon_photo:
+                self.window.wm_iconphoto(True, self.icon_photo)
+        except Exception:
+            pass
     
     def show_error_and_exit(self, title, message):
         """显示错误并退出"""
@@ -986,6 +1263,57 @@ class DITCopyTool:
             command=self.on_multi_dest_toggle
         )
         multi_dest_cb.pack(pady=(10, 0), anchor="w")
+        
+        concurrency_row = tb.Frame(settings_frame)
+        concurrency_row.pack(fill="x", pady=(10, 0))
+        tb.Label(concurrency_row, text="并行拷贝文件数").pack(side="left")
+        self.copy_concurrency_var = tk.IntVar(value=self.copy_concurrency)
+        concurrency_spin = tb.Spinbox(
+            concurrency_row,
+            from_=1,
+            to=16,
+            width=5,
+            textvariable=self.copy_concurrency_var,
+            bootstyle="info"
+        )
+        concurrency_spin.pack(side="left", padx=(8, 0))
+        concurrency_help = tb.Label(
+            concurrency_row,
+            text="?",
+            font=("Arial", 10, "bold"),
+            bootstyle="info",
+            cursor="hand2"
+        )
+        concurrency_help.pack(side="left", padx=(8, 0))
+        Tooltip(concurrency_help, "同时拷贝的文件数量。小文件多时适当调高可提升速度，机械硬盘或读卡器建议保持1-4。")
+        
+        parallel_verify_row = tb.Frame(settings_frame)
+        parallel_verify_row.pack(fill="x", pady=(10, 0))
+        self.parallel_verify_var = tk.BooleanVar(value=True)
+        parallel_verify_cb = tb.Checkbutton(
+            parallel_verify_row,
+            text="并行MD5验证",
+            variable=self.parallel_verify_var,
+            bootstyle="info-round-toggle"
+        )
+        parallel_verify_cb.pack(side="left")
+        parallel_verify_help = tb.Label(
+            parallel_verify_row,
+            text="?",
+            font=("Arial", 10, "bold"),
+            bootstyle="info",
+            cursor="hand2"
+        )
+        parallel_verify_help.pack(side="left", padx=(8, 0))
+        Tooltip(parallel_verify_help, "启用后按CPU核心数（最多8个）同时验证多个文件，适合SSD目标盘。目标为机械硬盘时建议关闭，避免磁头来回寻道。")
+    
+    def get_copy_concurrency(self):
+        """读取并行拷贝文件数，限制在1-16之间"""
+        try:
+            value = int(self.copy_concurrency_var.get())
+        except Exception:
+            return self.copy_concurrency
+        return min(max(value, 1), 16)
     
     def on_only_media_toggle(self):
         if self.only_media_var.get():
@@ -1041,7 +1369,7 @@ class DITCopyTool:
                     s = "." + s
                 cleaned.add(s)
             if cleaned:
-                self.media_extensions = cleaned
+                self.media_extensions = frozenset(cleaned)
             editor.destroy()
         
         save_btn = tb.Button(button_frame, text="保存", bootstyle="success", command=save, width=12)
@@ -1231,7 +1559,6 @@ class DITCopyTool:
         exit_btn.pack(side="right")
         
     def is_christmas_period(self):
-        from datetime import datetime
         now = datetime.now()
         return now.month == 12 and 20 <= now.day <= 30
     
@@ -1256,29 +1583,17 @@ class DITCopyTool:
         
     def format_time(self, seconds):
         """格式化时间显示"""
-        if seconds <= 0:
-            return "00:00"
-        
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        
-        if minutes >= 60:
-            hours = minutes // 60
-            minutes = minutes % 60
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return format_clock(int(seconds) if seconds > 0 else 0)
             
     def update_total_size(self):
         """更新总大小显示"""
-        total_size = sum(item['size'] for item in self.source_items)
-        size_str = self.copy_manager.format_size(total_size)
-        self.folder_size_label.config(text=f"总大小: {size_str}")
+        total_size = self._total_size
+        text = f"总大小: {self.copy_manager.format_size(total_size)}"
         
         # 如果总大小超过1GB，显示更详细的信息
         if total_size > 1024**3:
-            gb_size = total_size / (1024**3)
-            self.folder_size_label.config(text=f"总大小: {size_str} ({gb_size:.2f} GB)")
+            text += f" ({total_size / (1024**3):.2f} GB)"
+        self.folder_size_label.config(text=text)
             
     def add_source_folder(self):
         """添加源文件夹"""
@@ -1309,6 +1624,7 @@ class DITCopyTool:
                     source_item['display'] = f"{folder_name} - {size_str} (→ {custom_name})"
                 
                 self.source_items.append(source_item)
+                self._total_size += total_size
                 self.source_items_listbox.insert(tk.END, source_item['display'])
                 self.log_message(f"添加源文件夹: {folder} ({size_str})")
                 if custom_name != folder_name:
@@ -1418,6 +1734,7 @@ class DITCopyTool:
             # 从后往前删除，避免索引问题
             for index in reversed(selection):
                 removed_item = self.source_items.pop(index)
+                self._total_size -= removed_item['size']
                 self.source_items_listbox.delete(index)
                 self.log_message(f"移除源文件夹: {removed_item['path']}")
             
@@ -1440,6 +1757,7 @@ class DITCopyTool:
         
         if result:
             self.source_items.clear()
+            self._total_size = 0
             self.source_items_listbox.delete(0, tk.END)
             self.update_total_size()
             self.log_message("清空所有源文件夹")
@@ -1513,7 +1831,6 @@ class DITCopyTool:
     def update_folder_preview(self):
         """更新文件夹名称预览"""
         # 生成预览文件夹名称
-        from datetime import datetime
         project_name = self.project_name_var.get().strip()
         
         # 清理项目名称中的特殊字符
@@ -1538,11 +1855,7 @@ class DITCopyTool:
         self.folder_preview_label.config(text=f"📁 将创建文件夹: {folder_name}")
     
     def get_media_extensions(self):
-        return getattr(self, "media_extensions", set())
-    
-    def is_media_file(self, file_path):
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in self.get_media_extensions()
+        return getattr(self, "media_extensions", frozenset())
             
     def start_copy(self):
         """开始拷贝"""
@@ -1576,6 +1889,29 @@ class DITCopyTool:
         self.copy_thread.daemon = True
         self.copy_thread.start()
         
+        # 拷贝期间定时显示日志、刷新进度并将日志缓冲区写入文件
+        self.window.after(200, self._flush_log_periodic)
+        
+    def _flush_log_periodic(self):
+        """定时显示拷贝线程产生的日志并刷新日志缓冲区，拷贝结束且日志关闭后停止"""
+        if self.copy_manager is None:
+            return
+        self._flush_log_view()
+        self.copy_manager.flush_log()
+        if self.copy_thread and self.copy_thread.is_alive():
+            self._refresh_progress()
+        if self.copy_manager.log_file or self._pending_log or (self.copy_thread and self.copy_thread.is_alive()):
+            self.window.after(200, self._flush_log_periodic)
+        
+    def _refresh_progress(self):
+        """在主线程中刷新进度显示；拷贝和验证线程只更新计数器，不直接操作界面控件"""
+        if self.copy_manager.backup_copying:
+            self.update_backup_progress()
+        else:
+            self.update_progress()
+        if self.copy_manager.verifying:
+            self.update_verify_progress()
+        
     def stop_copy(self):
         """停止拷贝"""
         self.copy_manager.copying = False
@@ -1583,7 +1919,6 @@ class DITCopyTool:
         
     def copy_process(self):
         """拷贝过程"""
-        import time
         try:
             self.copy_manager.copying = True
             self.copy_manager.total_files = 0
@@ -1591,6 +1926,12 @@ class DITCopyTool:
             self.copy_manager.verified_files = 0
             self.copy_manager.total_size = 0
             self.copy_manager.copied_size = 0
+            self.copy_manager.partial_size = 0
+            self.copy_manager.source_hashes.clear()
+            self._missing_parent_reports.clear()
+            self.copy_concurrency = self.get_copy_concurrency()
+            # 并行验证时按CPU核心数启动验证线程，机械硬盘关闭后只用一个线程顺序读取
+            self.verify_workers = min(8, os.cpu_count() or 1) if self.parallel_verify_var.get() else 1
             
             # 重置日期文件夹，确保每次拷贝都使用新的时间戳
             self.copy_manager.date_folder = None
@@ -1638,36 +1979,39 @@ class DITCopyTool:
             
             # 统计总文件数和总大小
             self.log_message("正在统计文件...")
+            only_media = self.only_media_var.get()
+            media_extensions = self.get_media_extensions()
             for source_item in self.source_items:
-                for root, dirs, files in os.walk(source_item['path']):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if self.only_media_var.get() and not self.is_media_file(file_path):
-                            continue
-                        self.copy_manager.total_files += 1
-                        try:
-                            self.copy_manager.total_size += os.path.getsize(file_path)
-                        except:
-                            pass
+                # 拷贝前重新扫描，保证清单与磁盘一致
+                _, entries, _ = self.copy_manager.scan_tree(source_item['path'], refresh=True)
+                for file_path, file_size, ext in entries:
+                    # 扩展名在扫描时已取好，这里只做一次集合查找
+                    if only_media and ext not in media_extensions:
+                        continue
+                    self.copy_manager.total_files += 1
+                    self.copy_manager.total_size += file_size
                             
-            self.update_stats()
+            self._run_in_ui(self.update_stats)
             self.log_message(f"总计 {self.copy_manager.total_files} 个文件 ({self.copy_manager.format_size(self.copy_manager.total_size)})")
             
             # 记录开始时间
             self.copy_manager.copy_start_time = time.time()
             
+            # 启动验证线程，拷贝与验证流水线并行
+            self.verify_files()
+            
             # 开始拷贝
-            for source_item in self.source_items:
-                if not self.copy_manager.copying:
-                    break
-                
-                # 使用自定义名称进行拷贝
-                folder_name = source_item.get('custom_name', source_item['name'])
-                self.copy_folder(source_item['path'], final_dest, folder_name)
-                
-            # 开始验证
-            if self.copy_manager.copying and self.copy_manager.copied_files > 0:
-                self.verify_files()
+            try:
+                for source_item in self.source_items:
+                    if not self.copy_manager.copying:
+                        break
+                    
+                    # 使用自定义名称进行拷贝
+                    folder_name = source_item.get('custom_name', source_item['name'])
+                    self.copy_folder(source_item['path'], final_dest, folder_name)
+            finally:
+                # 等待验证线程处理完剩余文件
+                self.finish_verify_files()
             
             if self.copy_manager.copying and self.multi_dest_var.get() and self.backup_dest_paths:
                 self.log_message("开始拷贝到备用目的地")
@@ -1684,110 +2028,183 @@ class DITCopyTool:
                     self.copy_manager.backup_total_size = self.copy_manager.total_size
                     self.copy_manager.backup_copied_files = 0
                     self.copy_manager.backup_copied_size = 0
-                    self.backup_progress.config(value=0)
+                    self._run_in_ui(self.backup_progress.config, value=0)
                     if self.auto_folder_var.get():
                         backup_final_dest = os.path.join(backup_dest, backup_date_folder)
                     else:
                         backup_final_dest = backup_dest
                     os.makedirs(backup_final_dest, exist_ok=True)
                     self.log_message(f"创建备用目标文件夹: {backup_final_dest}")
-                    self.backup_status_label.config(text=f"正在拷贝到备用目的地 {self.copy_manager.current_backup_index}/{self.copy_manager.total_backup_destinations}: {backup_dest}")
+                    self._run_in_ui(self.backup_status_label.config, text=f"正在拷贝到备用目的地 {self.copy_manager.current_backup_index}/{self.copy_manager.total_backup_destinations}: {backup_dest}")
                     for source_item in self.source_items:
                         if not self.copy_manager.copying:
                             break
                         folder_name = source_item.get('custom_name', source_item['name'])
                         self.copy_folder(source_item['path'], backup_final_dest, folder_name)
-                    self.backup_progress.config(value=100)
+                    self._run_in_ui(self.backup_progress.config, value=100)
                 self.copy_manager.backup_copying = False
                 self.log_message("备用目的地拷贝完成")
                 self.verify_backup_destinations()
                 
-            # 完成
+            # 完成（更新界面、弹出提示和庆祝窗口都交给主线程）
             if self.copy_manager.copying:
-                self.copy_complete()
+                self._run_in_ui(self.copy_complete)
             else:
-                self.copy_stopped()
+                self._run_in_ui(self.copy_stopped)
                 
         except Exception as e:
             self.log_message(f"拷贝过程出错: {str(e)}")
-            messagebox.showerror("错误", f"拷贝过程出错: {str(e)}")
+            self._run_in_ui(messagebox.showerror, "错误", f"拷贝过程出错: {str(e)}")
             
         finally:
             # 恢复按钮状态
-            self.start_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
+            self._run_in_ui(self.start_btn.config, state="normal")
+            self._run_in_ui(self.stop_btn.config, state="disabled")
             
+    def _run_in_ui(self, func, *args, **kwargs):
+        """在主线程中执行界面操作：拷贝线程不直接操作Tk控件，交给事件循环按提交顺序执行"""
+        self.window.after(0, lambda: func(*args, **kwargs))
+        
     def copy_file_with_progress(self, source_file, dest_file, file_size):
         """优化的分块拷贝文件，支持实时进度更新"""
-        import time
         
         # 根据文件大小调整块大小 - 优化大文件处理
-        if file_size > 500 * 1024 * 1024:  # 大于500MB
-            chunk_size = 16 * 1024 * 1024  # 16MB块
-        elif file_size > 100 * 1024 * 1024:  # 大于100MB
-            chunk_size = 8 * 1024 * 1024   # 8MB块
-        elif file_size > 10 * 1024 * 1024:  # 大于10MB
-            chunk_size = 4 * 1024 * 1024   # 4MB块
-        else:
-            chunk_size = 1024 * 1024       # 1MB块
+        chunk_size = _copy_chunk_size(file_size)
             
         copied_size = 0
+        reported_size = 0  # 已计入copy_manager.partial_size的字节数
         last_update_time = time.time()
         last_progress_log = 0  # 上次记录进度的时间
         update_interval = 0.2  # 减少更新频率到200ms
         
+        def report_progress():
+            """按间隔更新进度，避免过于频繁"""
+            nonlocal last_update_time, last_progress_log, reported_size
+            current_time = time.time()
+            if current_time - last_update_time < update_interval:
+                return
+            # 对于大文件，记录进度百分比（减少日志频率）
+            if file_size > 100 * 1024 * 1024 and current_time - last_progress_log >= 10:  # 每10秒记录一次
+                progress_percent = (copied_size / file_size) * 100
+                self.log_message(f"⏳ 拷贝进度: {progress_percent:.1f}% ({self.copy_manager.format_size(copied_size)}/{self.copy_manager.format_size(file_size)})")
+                last_progress_log = current_time
+            
+            # 未拷完文件的已拷贝部分累计到partial_size，多个拷贝线程各自累加，由主线程定时显示
+            if not self.copy_manager.backup_copying and self.copy_manager.total_size > 0:
+                with self.copy_manager.progress_lock:
+                    self.copy_manager.partial_size += copied_size - reported_size
+                reported_size = copied_size
+            
+            last_update_time = current_time
+        
         # 对于大文件，显示开始拷贝信息
         if file_size > 50 * 1024 * 1024:
             self.log_message(f"📁 开始拷贝大文件: {os.path.basename(source_file)} ({self.copy_manager.format_size(file_size)})")
         
         try:
-            # 使用缓冲IO提高性能
-            with open(source_file, 'rb', buffering=chunk_size) as src:
-                with open(dest_file, 'wb', buffering=chunk_size) as dst:
+            if self.copy_manager.backup_copying and sys.platform.startswith("linux"):
+                # 备用目的地不需要源文件哈希，直接在内核中拷贝，数据不经过用户态
+                with open(source_file, 'rb', buffering=0) as src:
+                    with open(dest_file, 'wb', buffering=0) as dst:
+                        src_fd = src.fileno()
+                        dst_fd = dst.fileno()
+                        _advise_sequential_read(src_fd, file_size)
+                        if file_size > _BASE_COPY_CHUNK_SIZE:
+                            _preallocate(dst_fd, file_size)
+                        use_copy_range = hasattr(os, "copy_file_range")
+                        while self.copy_manager.copying:
+                            try:
+                                if use_copy_range:
+                                    copied = os.copy_file_range(src_fd, dst_fd, chunk_size)
+                                else:
+                                    copied = os.sendfile(dst_fd, src_fd, None, chunk_size)
+                            except OSError as e:
+                                # 跨文件系统或文件系统不支持时改用sendfile
+                                if use_copy_range and copied_size == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                                    use_copy_range = False
+                                    continue
+                                raise
+                            if not copied:
+                                break
+                            copied_size += copied
+                            report_progress()
+                        # 备用目的地只做大小验证，不需要落盘，只释放页缓存
+                        _advise_drop_cache(dst_fd)
+                return
+            
+            if file_size < _BASE_COPY_CHUNK_SIZE:
+                # 小文件（缩略图、元数据等）一次读完直接写入，不分配块缓冲区，也不逐块检查进度
+                with open(source_file, 'rb', buffering=0) as src:
+                    data = src.read()
+                with open(dest_file, 'wb', buffering=0) as dst:
+                    chunk = memoryview(data)
+                    while chunk:
+                        chunk = chunk[dst.write(chunk):]
+                    # 小文件不落盘（见_SYNC_MIN_SIZE）
+                    _sync_written_file(dst.fileno(), file_size)
+                if not self.copy_manager.backup_copying:
+                    self.copy_manager.source_hashes[dest_file] = hashlib.md5(data).hexdigest()
+                return
+            
+            # 边拷贝边计算源文件MD5，读入的数据块直接复用，验证时无需再读一遍源文件
+            # 备用目的地只做大小验证，不需要哈希
+            src_hash = None if self.copy_manager.backup_copying else hashlib.md5()
+            # 预分配一个块缓冲区反复读入，哈希和写入都直接使用其切片视图，每块不再分配新的bytes对象
+            buffer = bytearray(chunk_size)
+            buffer_view = memoryview(buffer)
+            # 每次按整块读写，源文件和目标文件都不再套一层缓冲区
+            with open(source_file, 'rb', buffering=0) as src:
+                with open(dest_file, 'wb', buffering=0) as dst:
+                    _advise_sequential_read(src.fileno(), file_size)
+                    if file_size > _BASE_COPY_CHUNK_SIZE:
+                        _preallocate(dst.fileno(), file_size)
                     while True:
                         if not self.copy_manager.copying:
                             break
                             
                         # 读取数据块
-                        chunk = src.read(chunk_size)
-                        if not chunk:
+                        read_size = src.readinto(buffer)
+                        if not read_size:
+                            # 完整读完才记录哈希，中途停止的文件不参与比对
+                            if src_hash is not None:
+                                self.copy_manager.source_hashes[dest_file] = src_hash.hexdigest()
                             break
                             
-                        # 写入数据块
-                        dst.write(chunk)
-                        copied_size += len(chunk)
-                        
-                        # 按间隔更新进度，避免过于频繁
-                        current_time = time.time()
-                        if current_time - last_update_time >= update_interval:
-                            # 对于大文件，记录进度百分比（减少日志频率）
-                            if file_size > 100 * 1024 * 1024 and current_time - last_progress_log >= 10:  # 每10秒记录一次
-                                progress_percent = (copied_size / file_size) * 100
-                                self.log_message(f"⏳ 拷贝进度: {progress_percent:.1f}% ({self.copy_manager.format_size(copied_size)}/{self.copy_manager.format_size(file_size)})")
-                                last_progress_log = current_time
-                            
-                            # 批量更新进度（减少UI更新频率）
-                            if not self.copy_manager.backup_copying and self.copy_manager.total_size > 0:
-                                file_progress_ratio = copied_size / file_size if file_size > 0 else 0
-                                temp_copied_size = self.copy_manager.copied_size + (file_size * file_progress_ratio)
-                                temp_copied_size = min(temp_copied_size, self.copy_manager.total_size)
-                                if abs(temp_copied_size - self.copy_manager.copied_size) > (self.copy_manager.total_size * 0.01):
-                                    original_copied_size = self.copy_manager.copied_size
-                                    self.copy_manager.copied_size = temp_copied_size
-                                    self.update_progress()
-                                    self.copy_manager.copied_size = original_copied_size
-                            
-                            self.window.update()
-                            last_update_time = current_time
+                        # 写入数据块（无缓冲写入可能只写入一部分，循环直到写完）
+                        chunk = buffer_view[:read_size]
+                        if src_hash is not None:
+                            src_hash.update(chunk)
+                        while chunk:
+                            chunk = chunk[dst.write(chunk):]
+                        copied_size += read_size
+                        report_progress()
+                    
+                    # 落盘后释放目标文件的页缓存，验证时从介质读取，也避免大量拷贝挤占内存
+                    _sync_written_file(dst.fileno(), file_size)
                             
         except Exception as e:
             # 如果分块拷贝失败，回退到标准拷贝
             self.log_message(f"分块拷贝失败，回退到标准拷贝: {str(e)}")
             shutil.copy2(source_file, dest_file)
+            # 同样落盘后再交给验证。Windows上刷新缓冲需要写权限，而copy2复制了权限位，
+            # 只读的源文件得到只读的目标文件，此时无法落盘，只记录日志；文件本身已拷贝完成
+            if file_size >= _SYNC_MIN_SIZE:
+                try:
+                    dst_fd = os.open(dest_file, (os.O_WRONLY if sys.platform == "win32" else os.O_RDONLY) | getattr(os, "O_BINARY", 0))
+                    try:
+                        _sync_written_file(dst_fd, file_size)
+                    finally:
+                        os.close(dst_fd)
+                except OSError as sync_error:
+                    self.log_message(f"⚠️ 目标文件落盘失败，验证可能读取缓存: {os.path.basename(dest_file)} - {sync_error}")
+        finally:
+            # 文件结束后由调用方按完整大小计入copied_size
+            if reported_size:
+                with self.copy_manager.progress_lock:
+                    self.copy_manager.partial_size -= reported_size
     
     def copy_folder(self, source_path, dest_path, folder_name):
         """拷贝文件夹"""
-        import time
         target_path = os.path.join(dest_path, folder_name)
         
         # 调试信息：路径构建
@@ -1799,148 +2216,177 @@ class DITCopyTool:
         
         os.makedirs(target_path, exist_ok=True)
         
-        for root, dirs, files in os.walk(source_path):
+        # 统计阶段刚扫描并缓存了文件清单，这里直接复用，不再重复遍历目录树
+        _, entries, dirs = self.copy_manager.scan_tree(source_path)
+        
+        # 清单中的路径都以source_path开头，直接截取前缀得到相对路径，省去逐个relpath/join
+        prefix_len = _relative_prefix_length(source_path)
+        dest_prefix = target_path + os.sep
+        
+        # 先创建全部子目录（包括空目录），保持与源目录相同的结构
+        for root in dirs:
             if not self.copy_manager.copying:
                 break
                 
-            # 创建子目录
-            rel_path = os.path.relpath(root, source_path)
-            if rel_path == '.':
-                current_dest = target_path
-            else:
-                current_dest = os.path.join(target_path, rel_path)
+            rel_path = root[prefix_len:]
+            current_dest = dest_prefix + rel_path
                 
-            # 调试信息：相对路径处理
-            self.log_message(f"📂 相对路径处理:")
-            self.log_message(f"   源根目录: {source_path}")
-            self.log_message(f"   当前源目录: {root}")
-            self.log_message(f"   相对路径: {rel_path}")
-            self.log_message(f"   目标根目录: {target_path}")
-            self.log_message(f"   当前目标目录: {current_dest}")
-                
-            # 调试信息：目录创建
-            self.log_message(f"📂 创建目录: {current_dest}")
+            if self.debug:
+                # 调试信息：相对路径处理
+                self.log_message(f"📂 相对路径处理:")
+                self.log_message(f"   源根目录: {source_path}")
+                self.log_message(f"   当前源目录: {root}")
+                self.log_message(f"   相对路径: {rel_path}")
+                self.log_message(f"   目标根目录: {target_path}")
+                self.log_message(f"   当前目标目录: {current_dest}")
+                self.log_message(f"📂 创建目录: {current_dest}")
             try:
                 os.makedirs(current_dest, exist_ok=True)
-                self.log_message(f"   ✅ 目录创建成功: {current_dest}")
-                self.log_message(f"   📍 目录存在: {os.path.exists(current_dest)}")
             except Exception as e:
                 self.log_message(f"   ❌ 目录创建失败: {current_dest} - {str(e)}")
+        
+        # 收集待拷贝文件，大小沿用扫描时的结果
+        copy_jobs = []
+        only_media = self.only_media_var.get()
+        media_extensions = self.get_media_extensions()
+        for source_file, file_size, ext in entries:
+            if only_media and ext not in media_extensions:
+                continue
+            copy_jobs.append((source_file, dest_prefix + source_file[prefix_len:], file_size))
+        
+        # 从大到小拷贝：最大的文件最先开始，小文件填补空闲线程，避免最后只剩一个大文件在拷
+        copy_jobs.sort(key=lambda job: job[2], reverse=True)
+        next_index = itertools.count()
+        index_lock = threading.Lock()
+        
+        def copy_worker():
+            """每个拷贝线程依次领取下一个未拷贝的文件"""
+            while self.copy_manager.copying:
+                with index_lock:
+                    index = next(next_index)
+                if index >= len(copy_jobs):
+                    return
+                # 提示内核预读本线程之后将领取的文件，与当前文件的拷贝重叠
+                next_job = index + worker_count
+                if next_job < len(copy_jobs):
+                    _prefetch_file(copy_jobs[next_job][0], copy_jobs[next_job][2])
+                self.copy_one_file(*copy_jobs[index])
+        
+        # 多个文件同时拷贝，提高目标设备的队列深度
+        worker_count = min(self.copy_concurrency, len(copy_jobs))
+        if worker_count > 1:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                for _ in range(worker_count):
+                    executor.submit(copy_worker)
+        else:
+            copy_worker()
+    
+    def copy_one_file(self, source_file, dest_file, file_size):
+        """拷贝单个文件并更新进度（可能在多个拷贝线程中同时调用）"""
+        file = os.path.basename(source_file)
+        try:
+            copy_start = time.time()
             
-            # 拷贝文件
-            for file in files:
-                if not self.copy_manager.copying:
-                    break
-                    
-                source_file = os.path.join(root, file)
-                dest_file = os.path.join(current_dest, file)
-                
-                if self.only_media_var.get() and not self.is_media_file(source_file):
-                    continue
-                
-                try:
-                    # 获取文件大小
-                    file_size = os.path.getsize(source_file)
-                    copy_start = time.time()
-                    
-                    # 调试信息
-                    self.log_message(f"📁 拷贝文件: {file}")
-                    self.log_message(f"   从: {source_file}")
-                    self.log_message(f"   到: {dest_file}")
-                    
-                    # 分块拷贝文件，支持实时进度更新
-                    self.copy_file_with_progress(source_file, dest_file, file_size)
-                    
-                    # 验证拷贝结果
-                    if os.path.exists(dest_file):
-                        self.log_message(f"   ✅ 拷贝成功: {file}")
-                        # 验证文件大小
-                        source_size = os.path.getsize(source_file)
-                        dest_size = os.path.getsize(dest_file)
-                        if source_size == dest_size:
-                            self.log_message(f"   ✅ 文件大小匹配: {source_size} bytes")
-                        else:
-                            self.log_message(f"   ⚠️ 文件大小不匹配: 源={source_size}, 目标={dest_size}")
-                    else:
-                        self.log_message(f"   ❌ 拷贝后文件不存在: {file}")
-                        # 检查父目录
-                        parent_dir = os.path.dirname(dest_file)
-                        self.log_message(f"   📍 父目录: {parent_dir}")
-                        self.log_message(f"   📂 父目录存在: {os.path.exists(parent_dir)}")
-                        if os.path.exists(parent_dir):
-                            files = os.listdir(parent_dir)
-                            self.log_message(f"   📄 父目录内容: {files}")
-                    
-                    # 文件拷贝完成，更新进度
-                    copy_time = time.time() - copy_start
-                    if self.copy_manager.backup_copying:
-                        self.copy_manager.backup_copied_files += 1
-                        self.copy_manager.backup_copied_size += file_size
-                        self.update_backup_progress()
-                    else:
-                        self.copy_manager.copied_files += 1
-                        self.copy_manager.copied_size += file_size
-                        if copy_time > 0:
-                            file_speed = file_size / copy_time
-                            self.copy_manager.copy_speed = file_speed
-                        self.update_progress()
-                    self.log_message(f"已拷贝: {file} ({self.copy_manager.format_size(file_size)})")
-                except Exception as e:
-                    self.log_message(f"拷贝失败 {file}: {str(e)}")
+            if self.debug:
+                self.log_message(f"📁 拷贝文件: {file}")
+                self.log_message(f"   从: {source_file}")
+                self.log_message(f"   到: {dest_file}")
+            
+            # 分块拷贝文件，支持实时进度更新
+            self.copy_file_with_progress(source_file, dest_file, file_size)
+            
+            # 验证拷贝结果：一次stat同时确认存在并取得大小，源文件大小沿用拷贝前的值
+            try:
+                dest_size = os.stat(dest_file).st_size
+            except FileNotFoundError:
+                dest_size = None
+            if dest_size is not None:
+                # 验证文件大小
+                if file_size != dest_size:
+                    self.log_message(f"   ⚠️ 文件大小不匹配: 源={file_size}, 目标={dest_size}")
+                elif self.debug:
+                    self.log_message(f"   ✅ 拷贝成功: {file}")
+                    self.log_message(f"   ✅ 文件大小匹配: {file_size} bytes")
+            else:
+                self.log_message(f"   ❌ 拷贝后文件不存在: {file}")
+                self.report_missing_parent(dest_file)
+            
+            # 文件拷贝完成，更新计数器（在多个拷贝线程间共享，界面由主线程定时刷新）
+            copy_time = time.time() - copy_start
+            if self.copy_manager.backup_copying:
+                with self.copy_manager.progress_lock:
+                    self.copy_manager.backup_copied_files += 1
+                    self.copy_manager.backup_copied_size += file_size
+            else:
+                with self.copy_manager.progress_lock:
+                    self.copy_manager.copied_files += 1
+                    self.copy_manager.copied_size += file_size
+                if copy_time > 0:
+                    file_speed = file_size / copy_time
+                    self.copy_manager.copy_speed = file_speed
+                # 交给验证线程，与后续文件的拷贝并行验证
+                if self._verify_queue is not None:
+                    self._verify_queue.put((source_file, dest_file, file_size))
+            self.log_message(f"已拷贝: {file} ({self.copy_manager.format_size(file_size)})")
+        except Exception as e:
+            self.log_message(f"拷贝失败 {file}: {str(e)}")
                     
     def verify_files(self):
-        """验证文件"""
-        import time
+        """启动验证线程，拷贝完成的文件逐个进入队列，由多个验证线程同时验证"""
         self.copy_manager.verifying = True
         self.copy_manager.verify_start_time = time.time()
         self.copy_manager.md5_start_time = time.time()  # MD5验证开始时间
         self.copy_manager.md5_verified_files = 0
         self.copy_manager.md5_calc_size = 0
         
-        # 统计需要验证的文件总数
-        total_files = 0
-        for source_item in self.source_items:
-            for root, dirs, files in os.walk(source_item['path']):
-                total_files += len(files)
-        self.copy_manager.total_md5_files = total_files
+        # 需要验证的文件即本次要拷贝的文件
+        self.copy_manager.total_md5_files = self.copy_manager.total_files
         
-        self.log_message(f"开始MD5验证，共 {total_files} 个文件...")
+        self.log_message(f"开始MD5验证，共 {self.copy_manager.total_md5_files} 个文件...")
         
-        # 构建与拷贝时相同的目标路径
-        if self.auto_folder_var.get():
-            # 使用拷贝时保存的日期文件夹，确保时间戳一致
-            if self.copy_manager.date_folder is not None:
-                final_dest = os.path.join(self.destination_path, self.copy_manager.date_folder)
-            else:
-                # 如果date_folder不存在，生成新的（这种情况不应该发生）
-                final_dest = self.destination_path
-        else:
-            final_dest = self.destination_path
+        # 验证线程共用一个校验器计算哈希；每个文件只验证一次，缓存只保留少量条目，不随文件数增长
+        self.md5_verifier = md5_verifier.MD5Verifier(cache_limit=self.md5_cache_limit)
         
-        # 这里应该实现MD5验证逻辑
-        # 简化版本：只检查文件是否存在
-        for source_item in self.source_items:
-            if not self.copy_manager.copying:
+        # 队列有上限，验证跟不上时拷贝线程会等待，避免积压过多
+        self._verify_queue = queue.Queue(maxsize=64)
+        self._verify_threads = [
+            threading.Thread(target=self._verify_worker, daemon=True)
+            for _ in range(self.verify_workers)
+        ]
+        for thread in self._verify_threads:
+            thread.start()
+    
+    def _verify_worker(self):
+        """验证线程：从队列取出已拷贝的文件进行验证，收到None时结束"""
+        while True:
+            item = self._verify_queue.get()
+            if item is None:
                 break
-            
-            source_path = source_item['path']
-            # 使用与拷贝时相同的路径构建逻辑，包括自定义名称
-            folder_name = source_item.get('custom_name', source_item['name'])
-            dest_path = os.path.join(final_dest, folder_name)
-            
-            # 调试信息：验证路径
-            self.log_message(f"🔍 验证路径构建:")
-            self.log_message(f"   源项目路径: {source_item['path']}")
-            self.log_message(f"   源项目名称: {source_item['name']}")
-            self.log_message(f"   最终目标路径: {final_dest}")
-            self.log_message(f"   验证目标路径: {dest_path}")
-            if self.auto_folder_var.get() and self.copy_manager.date_folder:
-                self.log_message(f"   使用日期文件夹: {self.copy_manager.date_folder}")
-            
-            self.verify_folder(source_path, dest_path)
-            
+            # 停止后继续取出剩余项，保证拷贝线程不会阻塞在put上
+            if not self.copy_manager.copying:
+                continue
+            try:
+                self.verify_copied_file(*item)
+            except Exception as e:
+                self.log_message(f"   ❌ MD5验证错误: {os.path.basename(item[0])} - {str(e)}")
+    
+    def finish_verify_files(self):
+        """通知验证线程拷贝已结束，等待其完成并输出验证总结"""
+        if self._verify_queue is None:
+            return
+        # 每个验证线程各取一个None后结束
+        for _ in self._verify_threads:
+            self._verify_queue.put(None)
+        for thread in self._verify_threads:
+            thread.join()
+        self._verify_queue = None
+        self._verify_threads = []
+        self.md5_verifier = None
+        
+        if not (self.copy_manager.copying and self.copy_manager.copied_files > 0):
+            return
+        
         # 验证完成，显示总结
-        import time
         elapsed_time = time.time() - self.copy_manager.md5_start_time
         if elapsed_time > 0:
             self.copy_manager.md5_calc_speed = self.copy_manager.md5_calc_size / elapsed_time
@@ -1956,6 +2402,8 @@ class DITCopyTool:
         if not (self.multi_dest_var.get() and self.backup_dest_paths):
             return
         results = []
+        only_media = self.only_media_var.get()
+        media_extensions = self.get_media_extensions()
         if self.auto_folder_var.get():
             backup_date_folder = self.copy_manager.date_folder
         for backup_dest in self.backup_dest_paths:
@@ -1971,24 +2419,20 @@ class DITCopyTool:
                 source_path = source_item['path']
                 folder_name = source_item.get('custom_name', source_item['name'])
                 base_dest = os.path.join(backup_final_dest, folder_name)
-                for root, dirs, files in os.walk(source_path):
-                    rel_path = os.path.relpath(root, source_path)
-                    if rel_path == '.':
-                        current_dest = base_dest
-                    else:
-                        current_dest = os.path.join(base_dest, rel_path)
-                    for file in files:
-                        source_file = os.path.join(root, file)
-                        if self.only_media_var.get() and not self.is_media_file(source_file):
-                            continue
-                        total_files += 1
-                        dest_file = os.path.join(current_dest, file)
-                        if os.path.exists(dest_file):
-                            try:
-                                if os.path.getsize(source_file) == os.path.getsize(dest_file):
-                                    verified_files += 1
-                            except:
-                                verified_files += 1
+                # 复用拷贝时的扫描清单，源文件大小直接取自DirEntry，只需stat目标文件
+                _, entries, _ = self.copy_manager.scan_tree(source_path)
+                prefix_len = _relative_prefix_length(source_path)
+                dest_prefix = base_dest + os.sep
+                for source_file, file_size, ext in entries:
+                    if only_media and ext not in media_extensions:
+                        continue
+                    total_files += 1
+                    dest_file = dest_prefix + source_file[prefix_len:]
+                    try:
+                        if os.stat(dest_file).st_size == file_size:
+                            verified_files += 1
+                    except OSError:
+                        pass
             results.append({
                 "destination": backup_dest,
                 "total": total_files,
@@ -1998,112 +2442,115 @@ class DITCopyTool:
         self.log_message("备用目的地验证完成")
         self.copy_manager.verifying = False
         
-    def verify_folder(self, source_path, dest_path):
-        """验证文件夹"""
-        from md5_verifier import MD5Verifier
-        verifier = MD5Verifier()
+    def verify_copied_file(self, source_file, dest_file, file_size):
+        """MD5验证单个已拷贝的文件"""
+        file = os.path.basename(source_file)
         
-        for root, dirs, files in os.walk(source_path):
-            if not self.copy_manager.copying:
-                break
-                
-            rel_path = os.path.relpath(root, source_path)
-            if rel_path == '.':
-                current_dest = dest_path
-            else:
-                current_dest = os.path.join(dest_path, rel_path)
-                
-            for file in files:
-                if not self.copy_manager.copying:
-                    break
-                    
-                source_file = os.path.join(root, file)
-                dest_file = os.path.join(current_dest, file)
+        # 更新MD5验证进度（计数器在多个验证线程间共享）
+        with self.copy_manager.progress_lock:
+            self.copy_manager.md5_verified_files += 1
+            # 文件大小用于速度统计
+            self.copy_manager.md5_calc_size += file_size
+        
+        # 只stat一次目标文件，同时得到是否存在和大小，计算哈希时也复用
+        try:
+            dest_stat = os.stat(dest_file)
+            dest_size = dest_stat.st_size
+        except OSError:
+            dest_size = None
+        
+        if self.debug:
+            self.log_message(f"🔍 检查文件: {file}")
+            self.log_message(f"   源路径: {source_file}")
+            self.log_message(f"   目标路径: {dest_file}")
+            self.log_message(f"   目标存在: {dest_size is not None}")
+        
+        if dest_size is not None:
+            try:
+                # 大小不同则MD5不可能一致，直接判定失败，不再读取文件
+                if dest_size != file_size:
+                    self.log_message(f"   ❌ 大小不匹配: {file}")
+                    self.log_message(f"      源大小: {file_size}, 目标大小: {dest_size}")
+                    return
                 
-                # 更新MD5验证进度
-                self.copy_manager.md5_verified_files += 1
+                # 使用MD5验证文件 - 显示详细进度（进度和速度只用于调试日志，总结时再统一计算速度）
+                if self.debug:
+                    elapsed_time = time.time() - self.copy_manager.md5_start_time
+                    # 确保时间不为负数（防止系统时间被修改）
+                    if elapsed_time < 0:
+                        self.log_message(f"⚠️ 检测到负MD5时间: {elapsed_time:.2f}s，重置为0")
+                        elapsed_time = 0
+                    if elapsed_time > 0:
+                        self.copy_manager.md5_calc_speed = self.copy_manager.md5_calc_size / elapsed_time
+                    md5_progress = (self.copy_manager.md5_verified_files / self.copy_manager.total_md5_files) * 100
+                    self.log_message(f"🔍 [{md5_progress:.1f}%] 开始MD5验证: {file}")
+                    self.log_message(f"   进度: {self.copy_manager.md5_verified_files}/{self.copy_manager.total_md5_files} 文件")
+                    self.log_message(f"   速度: {self.copy_manager.format_size(int(self.copy_manager.md5_calc_speed))}/s")
                 
-                # 计算文件大小用于速度统计
-                try:
-                    file_size = os.path.getsize(source_file)
-                    self.copy_manager.md5_calc_size += file_size
-                except:
-                    file_size = 0
+                # 源文件MD5已在拷贝时计算，缺失时（如回退到标准拷贝）才重新读取
+                # 取出后即移除，拷贝大量文件时不累积占用内存
+                source_md5 = self.copy_manager.source_hashes.pop(dest_file, None)
+                if source_md5 is None:
+                    source_md5 = self.md5_verifier.calculate_md5(source_file)
                 
-                # 调试信息
-                self.log_message(f"🔍 检查文件: {file}")
-                self.log_message(f"   源路径: {source_file}")
-                self.log_message(f"   目标路径: {dest_file}")
-                self.log_message(f"   目标存在: {os.path.exists(dest_file)}")
+                # 计算目标文件MD5
+                dest_md5 = self.md5_verifier.calculate_md5(dest_file, stat=dest_stat, use_cache=False)
                 
-                if os.path.exists(dest_file):
-                    try:
-                        # 计算MD5验证进度和速度
-                        import time
-                        elapsed_time = time.time() - self.copy_manager.md5_start_time
-                        # 确保时间不为负数（防止系统时间被修改）
-                        if elapsed_time < 0:
-                            self.log_message(f"⚠️ 检测到负MD5时间: {elapsed_time:.2f}s，重置为0")
-                            elapsed_time = 0
-                        if elapsed_time > 0:
-                            self.copy_manager.md5_calc_speed = self.copy_manager.md5_calc_size / elapsed_time
-                        
-                        md5_progress = (self.copy_manager.md5_verified_files / self.copy_manager.total_md5_files) * 100
-                        
-                        # 使用MD5验证文件 - 显示详细进度
-                        self.log_message(f"🔍 [{md5_progress:.1f}%] 开始MD5验证: {file}")
-                        self.log_message(f"   进度: {self.copy_manager.md5_verified_files}/{self.copy_manager.total_md5_files} 文件")
-                        self.log_message(f"   速度: {self.copy_manager.format_size(int(self.copy_manager.md5_calc_speed))}/s")
-                        
-                        # 计算源文件MD5
-                        self.log_message(f"   计算源文件MD5...")
-                        source_md5 = verifier.calculate_md5(source_file)
-                        self.log_message(f"   源MD5: {source_md5}")
-                        
-                        # 计算目标文件MD5
-                        self.log_message(f"   计算目标文件MD5...")
-                        dest_md5 = verifier.calculate_md5(dest_file)
-                        self.log_message(f"   目标MD5: {dest_md5}")
-                        
-                        # 对比MD5值
-                        if source_md5 == dest_md5:
-                            self.copy_manager.verified_files += 1
-                            self.update_verify_progress()
-                            self.log_message(f"   ✅ MD5匹配: {file}")
-                            self.log_message(f"      哈希值: {source_md5}")
-                        else:
-                            self.log_message(f"   ❌ MD5不匹配: {file}")
-                            self.log_message(f"      源哈希: {source_md5}")
-                            self.log_message(f"      目标哈希: {dest_md5}")
-                            
-                    except Exception as e:
-                        self.log_message(f"   ❌ MD5验证错误: {file} - {str(e)}")
-                        self.log_message(f"      错误详情: {str(e)}")
+                # 对比MD5值
+                if source_md5 == dest_md5:
+                    with self.copy_manager.progress_lock:
+                        self.copy_manager.verified_files += 1
+                    self.log_message(f"   ✅ MD5匹配: {file}")
+                    self.log_message(f"      哈希值: {source_md5}")
                 else:
-                    self.log_message(f"⚠️ 文件不存在: {file}")
-                    # 检查父目录是否存在
-                    parent_dir = os.path.dirname(dest_file)
-                    self.log_message(f"   父目录存在: {os.path.exists(parent_dir)}")
-                    if os.path.exists(parent_dir):
-                        # 列出父目录中的文件
-                        try:
-                            files_in_dir = os.listdir(parent_dir)
-                            self.log_message(f"   父目录中的文件: {files_in_dir}")
-                        except:
-                            self.log_message(f"   无法读取父目录")
+                    self.log_message(f"   ❌ MD5不匹配: {file}")
+                    self.log_message(f"      源哈希: {source_md5}")
+                    self.log_message(f"      目标哈希: {dest_md5}")
                     
+            except Exception as e:
+                self.log_message(f"   ❌ MD5验证错误: {file} - {str(e)}")
+                self.log_message(f"      错误详情: {str(e)}")
+        else:
+            self.log_message(f"⚠️ 文件不存在: {file}")
+            self.report_missing_parent(dest_file)
+    
+    def report_missing_parent(self, dest_file):
+        """目标文件缺失时记录其父目录的情况；同一目录只详细记录前几次，整个目录缺失时不再对每个文件重复列出"""
+        parent_dir = os.path.dirname(dest_file)
+        with self.copy_manager.progress_lock:
+            count = self._missing_parent_reports.get(parent_dir, 0) + 1
+            self._missing_parent_reports[parent_dir] = count
+        if count > self.missing_parent_report_limit:
+            return
+        self.log_message(f"   📍 父目录: {parent_dir}")
+        # 一次listdir同时判断父目录是否存在并列出其中的文件
+        try:
+            files_in_dir = os.listdir(parent_dir)
+        except FileNotFoundError:
+            self.log_message("   📂 父目录存在: False")
+        except OSError:
+            self.log_message("   📂 父目录存在: True")
+            self.log_message("   无法读取父目录")
+        else:
+            self.log_message("   📂 父目录存在: True")
+            self.log_message(f"   📄 父目录中的文件: {files_in_dir}")
+        if count == self.missing_parent_report_limit:
+            self.log_message("   该目录下后续缺失的文件不再列出目录内容")
+    
     def update_progress(self):
         """更新拷贝进度"""
-        import time
         if self.copy_manager.total_files > 0:
             # 文件进度
             file_progress = (self.copy_manager.copied_files / self.copy_manager.total_files) * 100
             self.copy_progress.config(value=file_progress)
             
+            # 已拷贝大小，包含正在拷贝的文件中已写入的部分
+            copied_size = self.copy_manager.copied_size + self.copy_manager.partial_size
+            
             # 大小进度
             size_progress = 0
             if self.copy_manager.total_size > 0:
-                size_progress = (self.copy_manager.copied_size / self.copy_manager.total_size) * 100
+                size_progress = (copied_size / self.copy_manager.total_size) * 100
             
             # 时间计算
             elapsed_time = 0
@@ -2116,15 +2563,15 @@ class DITCopyTool:
             
             # 速度计算
             speed_mb_s = 0
-            if elapsed_time > 0 and self.copy_manager.copied_size >= 0:
-                speed_mb_s = (self.copy_manager.copied_size / (1024 * 1024)) / elapsed_time
+            if elapsed_time > 0 and copied_size >= 0:
+                speed_mb_s = (copied_size / (1024 * 1024)) / elapsed_time
                 # 确保速度不为负数
                 speed_mb_s = max(0, speed_mb_s)
             
             # 调试信息：如果速度异常，记录详细信息
             if speed_mb_s < 0 or speed_mb_s > 10000:  # 异常速度（负数或超过10GB/s）
                 self.log_message(f"⚠️ 速度异常: {speed_mb_s:.2f} MB/s")
-                self.log_message(f"   已拷贝大小: {self.copy_manager.copied_size} bytes ({self.copy_manager.format_size(self.copy_manager.copied_size)})")
+                self.log_message(f"   已拷贝大小: {copied_size} bytes ({self.copy_manager.format_size(copied_size)})")
                 self.log_message(f"   总大小: {self.copy_manager.total_size} bytes ({self.copy_manager.format_size(self.copy_manager.total_size)})")
                 self.log_message(f"   已用时间: {elapsed_time:.2f} seconds")
                 self.log_message(f"   开始时间: {self.copy_manager.copy_start_time}")
@@ -2132,8 +2579,8 @@ class DITCopyTool:
             
             # 预估剩余时间
             eta_seconds = 0
-            if speed_mb_s > 0 and self.copy_manager.total_size > self.copy_manager.copied_size:
-                remaining_mb = (self.copy_manager.total_size - self.copy_manager.copied_size) / (1024 * 1024)
+            if speed_mb_s > 0 and self.copy_manager.total_size > copied_size:
+                remaining_mb = (self.copy_manager.total_size - copied_size) / (1024 * 1024)
                 eta_seconds = remaining_mb / speed_mb_s
             
             # 格式化时间显示
@@ -2141,18 +2588,19 @@ class DITCopyTool:
             eta_str = self.format_time(eta_seconds)
             
             # 更新状态标签
-            self.copy_status_label.config(
-                text=f"已拷贝 {self.copy_manager.copied_files}/{self.copy_manager.total_files} 个文件 ({file_progress:.1f}%)"
+            self._set_label_text(
+                self.copy_status_label,
+                f"已拷贝 {self.copy_manager.copied_files}/{self.copy_manager.total_files} 个文件 ({file_progress:.1f}%)"
             )
-            self.copy_speed_label.config(
-                text=f"速度: {speed_mb_s:.1f} MB/s | 已用: {elapsed_str} | 剩余: {eta_str}"
+            self._set_label_text(
+                self.copy_speed_label,
+                f"速度: {speed_mb_s:.1f} MB/s | 已用: {elapsed_str} | 剩余: {eta_str}"
             )
             
             self.update_stats()
             
     def update_verify_progress(self):
         """更新验证进度"""
-        import time
         if self.copy_manager.total_files > 0:
             # 文件进度
             file_progress = (self.copy_manager.verified_files / self.copy_manager.total_files) * 100
@@ -2183,17 +2631,18 @@ class DITCopyTool:
             eta_str = self.format_time(eta_seconds)
             
             # 更新状态标签
-            self.verify_status_label.config(
-                text=f"已验证 {self.copy_manager.verified_files}/{self.copy_manager.total_files} 个文件 ({file_progress:.1f}%)"
+            self._set_label_text(
+                self.verify_status_label,
+                f"已验证 {self.copy_manager.verified_files}/{self.copy_manager.total_files} 个文件 ({file_progress:.1f}%)"
             )
-            self.verify_speed_label.config(
-                text=f"速度: {verify_speed:.1f} 文件/秒 | 已用: {elapsed_str} | 剩余: {eta_str}"
+            self._set_label_text(
+                self.verify_speed_label,
+                f"速度: {verify_speed:.1f} 文件/秒 | 已用: {elapsed_str} | 剩余: {eta_str}"
             )
             
             self.update_stats()
     
     def update_backup_progress(self):
-        import time
         if self.copy_manager.backup_total_files > 0:
             file_progress = (self.copy_manager.backup_copied_files / self.copy_manager.backup_total_files) * 100
             self.backup_progress.config(value=file_progress)
@@ -2211,14 +2660,18 @@ class DITCopyTool:
                 eta_seconds = remaining_files / speed_files_s
             elapsed_str = self.format_time(elapsed_time)
             eta_str = self.format_time(eta_seconds)
-            self.backup_status_label.config(text=f"备用拷贝 {self.copy_manager.current_backup_index}/{self.copy_manager.total_backup_destinations} | 速度: {speed_files_s:.1f} 文件/秒 | 已用: {elapsed_str} | 剩余: {eta_str}")
-            self.window.update()
+            self._set_label_text(self.backup_status_label, f"备用拷贝 {self.copy_manager.current_backup_index}/{self.copy_manager.total_backup_destinations} | 速度: {speed_files_s:.1f} 文件/秒 | 已用: {elapsed_str} | 剩余: {eta_str}")
             
     def update_stats(self):
         """更新统计信息"""
-        self.total_files_label.config(text=f"总文件数: {self.copy_manager.total_files}")
-        self.copied_files_label.config(text=f"已拷贝: {self.copy_manager.copied_files}")
-        self.verified_files_label.config(text=f"已验证: {self.copy_manager.verified_files}")
+        self._set_label_text(self.total_files_label, f"总文件数: {self.copy_manager.total_files}")
+        self._set_label_text(self.copied_files_label, f"已拷贝: {self.copy_manager.copied_files}")
+        self._set_label_text(self.verified_files_label, f"已验证: {self.copy_manager.verified_files}")
+    
+    def _set_label_text(self, label, text):
+        """文字变化时才更新标签，定时刷新进度时内容不变的标签不再触发重绘"""
+        if label.cget("text") != text:
+            label.config(text=text)
         
     def copy_complete(self):
         """拷贝完成"""
@@ -2227,6 +2680,7 @@ class DITCopyTool:
         self.verify_progress.config(value=100)
         self.copy_status_label.config(text="拷贝完成！")
         self.verify_status_label.config(text="验证完成！")
+        self.update_stats()
         if self.multi_dest_var.get() and self.backup_dest_paths:
             self.backup_progress.config(value=100)
             self.backup_status_label.config(text="备用拷贝完成！")
@@ -2295,7 +2749,7 @@ class DITCopyTool:
         """恢复主窗口图标 - 增强版本"""
         try:
             icon_path = get_icon_path()
-            if icon_path and 'PIL_Image' in globals() and 'PIL_ImageTk' in globals():
+            if icon_path:
                 icon_image = PIL_Image.open(icon_path)
                 self.icon_photo = PIL_ImageTk.PhotoImage(icon_image)  # 重新创建图标引用
                 
@@ -2470,7 +2924,9 @@ class DITCopyTool:
     def clear_all(self):
         """清空所有选择"""
         self.source_items.clear()
+        self._total_size = 0
         self.source_items_listbox.delete(0, tk.END)
+        self.update_total_size()
         self.destination_path = ""
         self.dest_path_label.config(text="未选择目的地")
         self.dest_info_label.config(text="")
@@ -2488,16 +2944,35 @@ class DITCopyTool:
         self.update_stats()
         
     def log_message(self, message):
-        """记录日志消息"""
+        """记录日志消息（可在拷贝/验证线程中调用）"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        self.window.update()
+        # 先放入待显示队列，由主线程定时批量插入日志框
+        self._pending_log.append(f"[{timestamp}] {message}\n")
         
         # 同时写入日志文件
         if self.copy_manager.log_file:
             self.copy_manager.write_log(message)
+        
+        # 主线程中的调用（非拷贝期间）直接显示
+        if threading.current_thread() is threading.main_thread():
+            self._flush_log_view()
+    
+    def _flush_log_view(self):
+        """将待显示的日志一次性插入日志框"""
+        if not self._pending_log:
+            return
+        lines = []
+        try:
+            while True:
+                lines.append(self._pending_log.popleft())
+        except IndexError:
+            pass
+        self.log_text.insert(tk.END, "".join(lines))
+        # 日志框只保留最近的行，完整日志在日志文件中；行数过多时Text插入和滚动都会变慢
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - self.log_view_max_lines
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        self.log_text.see(tk.END)
 
 class LogViewerWindow:
     """日志查看器窗口"""
@@ -2505,10 +2980,6 @@ class LogViewerWindow:
     def __init__(self):
         """初始化日志查看器 - 完全避免默认图标闪烁"""
         
-        # 确保重量级模块已导入
-        if 'tb' not in globals() or tb is None:
-            import_heavy_modules()
-        
         # 预加载图标
         preload_icon()
         self.icon_photo = None
@@ -2527,7 +2998,7 @@ class LogViewerWindow:
         # 尝试立即设置图标（窗口隐藏状态下）
         try:
             icon_image = get_global_icon_image()
-            if icon_image and 'PIL_ImageTk' in globals():
+            if icon_image:
                 self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                 self.window.wm_iconphoto(True, self.icon_photo)
                 if hasattr(self.window, 'iconphoto'):
@@ -2538,7 +3009,13 @@ class LogViewerWindow:
         
         self.log_dir = get_log_directory()
         self.current_log_file = None
-        self.current_log_content = ""
+        self.log_chunk_size = 512 * 1024  # 每次读取显示的日志字节数，超大日志先显示末尾
+        self._log_loaded_offset = 0  # 当前日志已显示部分在文件中的起始位置
+        self.log_insert_chunk_size = 64 * 1024  # 分段插入日志框时每段的字符数
+        self._log_pending_segments = []  # 尚未插入日志框的较早内容，从后往前排列
+        self._log_insert_job = None
+        self._log_list_cache = {}  # 文件名 -> (大小, 修改时间ns, 显示文字)，未变化的文件刷新时不再重新格式化
+        self._log_names = []  # 列表框中各行对应的文件名
         
         # 设置UI（窗口仍在隐藏状态）
         self.setup_ui()
@@ -2553,7 +3030,7 @@ class LogViewerWindow:
             # 尝试设置图标
             if not self.icon_photo:
                 icon_image = get_global_icon_image()
-                if icon_image and 'PIL_ImageTk' in globals():
+                if icon_image:
                     self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                     self.window.wm_iconphoto(True, self.icon_photo)
                     if hasattr(self.window, 'iconphoto'):
@@ -2563,9 +3040,9 @@ class LogViewerWindow:
             self.window.deiconify()
             print("日志查看器窗口已显示")
             
-            # 启动图标监控定时器
+            # 窗口重新映射（如最小化后还原）时才重新应用图标，不再定时轮询
             if self.icon_photo:
-                self._start_icon_monitor()
+                self.window.bind("<Map>", self._on_window_map)
                 
         except Exception as e:
             print(f"显示窗口时设置图标失败: {e}")
@@ -2580,20 +3057,19 @@ class LogViewerWindow:
             
             if icon_image and self.window:
                 # 为当前窗口创建专用的PhotoImage
-                if 'PIL_ImageTk' in globals():
-                    self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
+                self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                     
-                    # 使用多种方法设置图标，确保兼容性
-                    self.window.wm_iconphoto(True, self.icon_photo)
-                    if hasattr(self.window, 'iconphoto'):
-                        self.window.iconphoto(True, self.icon_photo)
+                # 使用多种方法设置图标，确保兼容性
+                self.window.wm_iconphoto(True, self.icon_photo)
+                if hasattr(self.window, 'iconphoto'):
+                    self.window.iconphoto(True, self.icon_photo)
                     
-                    # 启动图标监控定时器
-                    self._start_icon_monitor()
+                # 窗口重新映射时重新应用图标
+                self.window.bind("<Map>", self._on_window_map)
             elif not icon_image:
                 # 如果全局图标不可用，尝试本地创建
                 icon_path = get_icon_path()
-                if icon_path and 'PIL_Image' in globals() and 'PIL_ImageTk' in globals():
+                if icon_path:
                     icon_image = PIL_Image.open(icon_path)
                     self.icon_photo = PIL_ImageTk.PhotoImage(icon_image, master=self.window)
                     if self.window and self.icon_photo:
@@ -2601,8 +3077,8 @@ class LogViewerWindow:
                         if hasattr(self.window, 'iconphoto'):
                             self.window.iconphoto(True, self.icon_photo)
                         
-                        # 启动图标监控定时器
-                        self._start_icon_monitor()
+                        # 窗口重新映射时重新应用图标
+                        self.window.bind("<Map>", self._on_window_map)
         except Exception as e:
             print(f"设置日志查看器图标失败: {e}")
             pass
@@ -2706,6 +3182,16 @@ class LogViewerWindow:
         )
         refresh_btn.pack(side="left", padx=(0, 10))
         
+        # 加载更早内容按钮（日志较大时只显示末尾部分）
+        self.load_earlier_btn = tb.Button(
+            bottom_frame,
+            text="加载更早的日志",
+            bootstyle="info-outline",
+            command=self.load_earlier_log,
+            state="disabled"
+        )
+        self.load_earlier_btn.pack(side="left", padx=(0, 10))
+        
         # 导出按钮
         export_btn = tb.Button(
             bottom_frame,
@@ -2736,26 +3222,38 @@ class LogViewerWindow:
     def load_log_files(self):
         """加载日志文件列表"""
         self.log_listbox.delete(0, tk.END)
+        self._log_names = []
         
         try:
             if os.path.exists(self.log_dir):
-                log_files = [f for f in os.listdir(self.log_dir) if f.endswith('.log')]
-                log_files.sort(reverse=True)  # 最新的在前
+                # 一次scandir同时取得文件名和文件信息，不再逐个getsize/getmtime
+                with os.scandir(self.log_dir) as it:
+                    log_entries = [(entry.name, entry.stat()) for entry in it if entry.name.endswith('.log')]
+                log_entries.sort(reverse=True, key=lambda item: item[0])  # 最新的在前
                 
-                for log_file in log_files:
-                    # 获取文件信息
-                    file_path = os.path.join(self.log_dir, log_file)
-                    file_size = os.path.getsize(file_path)
-                    file_time = os.path.getmtime(file_path)
-                    file_date = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M')
-                    
-                    # 显示格式：文件名 (大小, 日期)
-                    size_str = self.format_size(file_size)
-                    display_text = f"{log_file} ({size_str}, {file_date})"
-                    self.log_listbox.insert(tk.END, display_text)
+                cache = {}
+                display_texts = []
+                for log_file, stat in log_entries:
+                    cached = self._log_list_cache.get(log_file)
+                    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                        display_text = cached[2]
+                    else:
+                        file_date = datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
+                        
+                        # 显示格式：文件名 (大小, 日期)
+                        size_str = self.format_size(stat.st_size)
+                        display_text = f"{log_file} ({size_str}, {file_date})"
+                    cache[log_file] = (stat.st_size, stat.st_mtime_ns, display_text)
+                    display_texts.append(display_text)
+                self._log_list_cache = cache
+                self._log_names = [log_file for log_file, _ in log_entries]
+                
+                # 一次插入全部条目
+                if display_texts:
+                    self.log_listbox.insert(tk.END, *display_texts)
                     
-                if log_files:
-                    self.log_info_label.config(text=f"找到 {len(log_files)} 个日志文件")
+                if display_texts:
+                    self.log_info_label.config(text=f"找到 {len(display_texts)} 个日志文件")
                 else:
                     self.log_info_label.config(text="暂无日志文件")
             else:
@@ -2766,18 +3264,7 @@ class LogViewerWindow:
     
     def format_size(self, size_bytes: int) -> str:
         """格式化文件大小显示"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and i < len(size_names) - 1:
-            size /= 1024
-            i += 1
-        
-        return f"{size:.1f} {size_names[i]}"
+        return format_size(size_bytes)
     
     def on_log_selected(self, event):
         """选择日志文件时的处理"""
@@ -2786,38 +3273,117 @@ class LogViewerWindow:
             return
             
         try:
-            # 获取选中的日志文件名
-            selected_text = self.log_listbox.get(selection[0])
-            log_filename = selected_text.split(' (')[0]  # 提取文件名
+            # 获取选中的日志文件名（直接按行号取，不再从列表框读回显示文字再解析）
+            log_filename = self._log_names[selection[0]]
             
-            # 读取日志内容
+            # 读取日志内容：只读取末尾部分，更早的内容按需加载，避免超大日志卡住界面
             log_path = os.path.join(self.log_dir, log_filename)
-            with open(log_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(log_path)
+            start, content = self._read_log_chunk(log_path, stat.st_size)
             
             self.current_log_file = log_filename
-            self.current_log_content = content
+            self._log_loaded_offset = start
             
             # 显示日志内容
+            self._cancel_log_insert()
             self.log_content_text.delete(1.0, tk.END)
-            self.log_content_text.insert(1.0, content)
+            self._insert_log_text(content)
+            self.log_content_text.see(tk.END)
+            self.load_earlier_btn.config(state="normal" if start > 0 else "disabled")
             
             # 更新信息标签
-            file_size = os.path.getsize(log_path)
-            file_time = os.path.getmtime(log_path)
-            file_date = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M:%S')
+            file_date = datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             
-            info_text = f"文件名: {log_filename} | 大小: {self.format_size(file_size)} | 修改时间: {file_date}"
+            info_text = f"文件名: {log_filename} | 大小: {self.format_size(stat.st_size)} | 修改时间: {file_date}"
+            if start > 0:
+                info_text += " | 仅显示末尾部分"
             self.log_info_label.config(text=info_text)
             
         except Exception as e:
             self.log_info_label.config(text=f"读取日志文件失败: {str(e)}")
+            self._cancel_log_insert()
             self.log_content_text.delete(1.0, tk.END)
             self.log_content_text.insert(1.0, f"错误: 无法读取日志文件\n\n{str(e)}")
+            self.load_earlier_btn.config(state="disabled")
+    
+    def _read_log_chunk(self, log_path: str, end: int):
+        """读取日志文件end之前最多log_chunk_size字节，从完整的一行开始，返回(起始位置, 文本)"""
+        start = max(0, end - self.log_chunk_size)
+        with open(log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        if start > 0:
+            # 丢弃开头不完整的一行，也避免从多字节字符中间开始解码
+            newline = data.find(b"\n")
+            if newline != -1:
+                start += newline + 1
+                data = data[newline + 1:]
+        return start, data.decode('utf-8', errors='replace')
+    
+    def _insert_log_text(self, content: str):
+        """
+        把日志文本插入日志框开头：最后一段立即插入，更早的段在之后的事件循环中从后往前
+        逐段插入，避免一次插入大量文本时界面卡住
+        """
+        segments = []
+        end = len(content)
+        while end > 0:
+            start = end - self.log_insert_chunk_size
+            # 在换行处分段；找不到换行时整段插入
+            start = content.rfind("\n", 0, start) + 1 if start > 0 else 0
+            segments.append(content[start:end])
+            end = start
+        if not segments:
+            return
+        self.log_content_text.insert(1.0, segments[0])
+        self._log_pending_segments = segments[1:]
+        if self._log_pending_segments:
+            self._log_insert_job = self.window.after(1, self._insert_next_log_segment)
+    
+    def _insert_next_log_segment(self):
+        """插入下一段较早的日志内容"""
+        self._log_insert_job = None
+        if not self._log_pending_segments:
+            return
+        self.log_content_text.insert(1.0, self._log_pending_segments.pop(0))
+        if self._log_pending_segments:
+            self._log_insert_job = self.window.after(1, self._insert_next_log_segment)
+    
+    def _cancel_log_insert(self):
+        """取消尚未完成的分段插入"""
+        if self._log_insert_job is not None:
+            self.window.after_cancel(self._log_insert_job)
+            self._log_insert_job = None
+        self._log_pending_segments = []
+    
+    def _finish_log_insert(self):
+        """立即插入所有剩余的分段"""
+        pending = self._log_pending_segments
+        self._cancel_log_insert()
+        if pending:
+            self.log_content_text.insert(1.0, "".join(reversed(pending)))
+    
+    def load_earlier_log(self):
+        """在日志内容前插入更早的一段"""
+        if not self.current_log_file or self._log_loaded_offset <= 0:
+            return
+        try:
+            log_path = os.path.join(self.log_dir, self.current_log_file)
+            start, content = self._read_log_chunk(log_path, self._log_loaded_offset)
+        except Exception as e:
+            self.log_info_label.config(text=f"读取日志文件失败: {str(e)}")
+            return
+        self._log_loaded_offset = start
+        # 先补齐仍在分段插入的内容，保证更早的一段插在最前面
+        self._finish_log_insert()
+        self.log_content_text.insert(1.0, content)
+        self.log_content_text.see(1.0)
+        if start == 0:
+            self.load_earlier_btn.config(state="disabled")
     
     def export_log(self):
         """导出当前选中的日志"""
-        if not self.current_log_file or not self.current_log_content:
+        if not self.current_log_file:
             messagebox.showwarning("提示", "请先选择一个日志文件")
             return
             
@@ -2831,8 +3397,8 @@ class LogViewerWindow:
         
         if export_path:
             try:
-                with open(export_path, 'w', encoding='utf-8') as f:
-                    f.write(self.current_log_content)
+                # 直接复制整个日志文件，日志框中可能只显示了末尾部分
+                shutil.copyfile(os.path.join(self.log_dir, self.current_log_file), export_path)
                 messagebox.showinfo("成功", f"日志已导出到:\n{export_path}")
             except Exception as e:
                 messagebox.showerror("错误", f"导出日志失败:\n{str(e)}")
@@ -2855,9 +3421,11 @@ class LogViewerWindow:
                 messagebox.showinfo("成功", "日志文件已删除")
                 
                 # 清空显示
+                self._cancel_log_insert()
                 self.log_content_text.delete(1.0, tk.END)
                 self.current_log_file = None
-                self.current_log_content = ""
+                self._log_loaded_offset = 0
+                self.load_earlier_btn.config(state="disabled")
                 
                 # 重新加载列表
                 self.load_log_files()
@@ -2891,24 +3459,12 @@ class LogViewerWindow:
         except Exception as e:
             print(f"应用窗口图标失败: {e}")
     
-    def _start_icon_monitor(self):
-        """启动图标监控定时器，防止图标被系统重置"""
-        def check_and_restore_icon():
-            try:
-                # 检查图标是否仍然有效
-                if self.window and self.icon_photo:
-                    # 重新应用图标
-                    self.window.wm_iconphoto(True, self.icon_photo)
-                    if hasattr(self.window, 'iconphoto'):
-                        self.window.iconphoto(True, self.icon_photo)
-                
-                # 每5秒检查一次
-                self.window.after(5000, check_and_restore_icon)
-            except Exception:
-                pass
-        
-        # 启动第一次检查
-        self.window.after(5000, check_and_restore_icon)
+    def _on_window_map(self, event):
+        """日志查看器窗口被映射时重新应用图标，防止图标被系统重置"""
+        # 绑定在顶层窗口上的事件也会被子控件触发，只处理窗口本身
+        if event.widget is not self.window:
+            return
+        self._apply_window_icon()
 
 
 def show_startup_error(message, detail=""):
@@ -2926,24 +3482,10 @@ def main():
     startup_window = None
     
     try:
-        # 预加载图标，确保在窗口创建前就可用了
-        startup_window = StartupWindow()
-        startup_window.update_progress("正在预加载图标...")
-        
-        # 在后台线程中预加载图标
-        def preload_icon_in_background():
-            try:
-                preload_success = preload_icon()
-                if preload_success:
-                    startup_window.update_progress("图标预加载成功...")
-                else:
-                    startup_window.update_progress("图标预加载失败，将使用默认设置...")
-            except Exception as e:
-                print(f"图标预加载异常: {e}")
-                startup_window.update_progress("图标预加载异常，继续启动...")
+        # 预加载图标，确保在窗口创建前就可用了（后台线程解码，与启动窗口创建重叠）
+        preload_icon()
         
-        # 立即开始图标预加载
-        threading.Thread(target=preload_icon_in_background, daemon=True).start()
+        startup_window = StartupWindow()
         
         # 快速依赖检查
         startup_window.update_progress("正在检查依赖...")
@@ -2951,9 +3493,22 @@ def main():
             startup_window.close()
             return
         
-        # 在后台线程中进行完整依赖检查
-        def check_deps_in_background():
-            success, error_msg = full_check_dependencies()
+        # 完整依赖检查和ttkbootstrap等重量级模块的预热都在后台线程中进行，不阻塞启动窗口绘制，
+        # 结果通过队列交回主线程
+        check_results = queue.Queue(maxsize=1)
+        
+        def prepare_in_background():
+            try:
+                success, error_msg = full_check_dependencies()
+                if success:
+                    prewarm_heavy_modules()
+            except Exception as e:
+                success, error_msg = False, str(e)
+            check_results.put((success, error_msg))
+        
+        threading.Thread(target=prepare_in_background, daemon=True).start()
+        
+        def start_app(success, error_msg):
             if not success:
                 startup_window.close()
                 show_startup_error("依赖检查失败", error_msg)
@@ -2970,8 +3525,16 @@ def main():
             app = DITCopyTool()
             app.window.mainloop()
         
-        # 延迟启动依赖检查，让图标预加载先完成
-        startup_window.root.after(800, check_deps_in_background)
+        # 在主线程中轮询后台检查结果，完成后再创建主界面（Tk控件只能在主线程中操作）
+        def wait_for_prepare():
+            try:
+                success, error_msg = check_results.get_nowait()
+            except queue.Empty:
+                return False
+            start_app(success, error_msg)
+            return True
+        
+        startup_window.add_tick_callback(wait_for_prepare)
         
         # 运行启动窗口的主循环
         startup_window.root.mainloop()
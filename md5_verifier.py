@@ -5,36 +5,288 @@ MD5验证模块
 
 import hashlib
 import os
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 
+try:
+    import blake3  # 可选依赖，安装后可使用algorithm="blake3"
+except ImportError:
+    blake3 = None
+
+# Windows上O_SEQUENTIAL对应FILE_FLAG_SEQUENTIAL_SCAN，其他平台没有该标志，改用posix_fadvise提示
+_SEQUENTIAL_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+
+def _fadvise(fd: int, advice_name: str):
+    """向内核提示文件的读取方式，平台不支持时忽略"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice_name))
+        except OSError:
+            pass
+
+def _iter_files(folder_path: str):
+    """
+    以os.scandir遍历文件夹中的所有文件
+    
+    与os.walk一致：不进入符号链接目录，跳过无法读取的目录。目录项的类型直接取自
+    scandir返回的信息（Linux上为readdir的d_type），不再逐个stat，也不为每个目录构造文件名列表
+    
+    Args:
+        folder_path: 文件夹路径
+        
+    Returns:
+        (文件路径, 相对路径) 的迭代器
+    """
+    prefix_len = len(os.path.join(folder_path, ""))
+    pending = [folder_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif entry.is_file():
+                        # 只产生普通文件（含指向文件的符号链接），管道、设备等特殊文件读取时可能一直阻塞
+                        yield entry.path, entry.path[prefix_len:]
+        except OSError:
+            continue
+
+# 系统自带的md5sum（coreutils），超大文件交给它计算
+_MD5SUM = shutil.which("md5sum")
+
+def _external_md5(file_path: str) -> Optional[str]:
+    """调用md5sum计算文件MD5，失败时返回None"""
+    try:
+        output = subprocess.run([_MD5SUM, "--", file_path], capture_output=True, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # md5sum不会释放读入的页缓存，计算完后同样提示内核丢弃
+    try:
+        fd = os.open(file_path, _SEQUENTIAL_READ_FLAGS)
+    except OSError:
+        pass
+    else:
+        _fadvise(fd, "POSIX_FADV_DONTNEED")
+        os.close(fd)
+    md5_hash = output[:32].decode("ascii", "replace").lower()
+    return md5_hash if len(md5_hash) == 32 and all(c in "0123456789abcdef" for c in md5_hash) else None
+
+def _stat_identity(stat: os.stat_result) -> Tuple[int, int, int, int, int]:
+    """
+    文件身份标识(设备, inode, 大小, 修改时间ns, 状态改变时间ns)，任一变化即视为文件已改动
+    
+    修改时间可被utime或copy2还原，状态改变时间无法由用户设置，写入内容后必然变化
+    """
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+def _readinto_full(f, view: memoryview) -> int:
+    """读满缓冲区（到达文件末尾时除外），返回读取的字节数"""
+    total = 0
+    while total < len(view):
+        read_size = f.readinto(view[total:])
+        if not read_size:
+            break
+        total += read_size
+    return total
+
 class MD5Verifier:
     """MD5验证器"""
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None, algorithm: str = "md5", cache_limit: Optional[int] = None):
         self.checksums = {}  # 存储文件校验和
+        # 哈希算法，默认MD5以兼容已有的checksums.md5；支持SHA-NI的CPU上可选sha256，安装blake3后可选blake3
+        self.algorithm = algorithm
+        # 校验和文件名按算法命名（checksums.md5、checksums.sha256等），避免md5sum -c等工具读到其他算法的摘要
+        self.checksum_file_name = f"checksums.{algorithm}"
+        self._new_hash()  # 不支持的算法在创建时即报错
+        # 已计算的哈希缓存：绝对路径 -> (文件身份标识, 哈希值)，文件未被替换或改动时直接复用
+        # 设置cache_limit时按最近使用保留，超出后淘汰最久未用的条目，避免大量文件时内存持续增长
+        self.cache_file = cache_file
+        self.cache_limit = cache_limit
+        self.hash_cache: Dict[str, Tuple[Tuple[int, int, int, int, int], str]] = OrderedDict()
+        self._cache_lock = threading.Lock()  # 多个线程同时计算时保护缓存的写入和淘汰
+        self.checksum_batch_size = 4096  # 创建校验和文件时每批计算并写出的文件数
+        self.checksum_read_limit = 64 * 1024 * 1024  # 校验和文件不超过此大小时整体读入解析
+        self.external_md5_threshold = 100 * 1024 * 1024  # 超过此大小的文件改用系统md5sum计算，进程启动开销可忽略
+        self.verify_side_workers = 1  # 验证文件夹时源和目标各自同时读取的文件数，1即每个磁盘保持一个顺序读取流
+        if cache_file:
+            self.load_cache()
+        
+    def _cached_hash(self, key: str) -> Optional[Tuple[Tuple[int, int, int, int, int], str]]:
+        """取出缓存条目并标记为最近使用"""
+        with self._cache_lock:
+            cached = self.hash_cache.get(key)
+            if cached is not None:
+                self.hash_cache.move_to_end(key)
+            return cached
+    
+    def _cache_hash(self, key: str, identity: Tuple[int, int, int, int, int], md5_hash: str):
+        """写入缓存条目，超出cache_limit时淘汰最久未用的条目"""
+        with self._cache_lock:
+            self.hash_cache[key] = (identity, md5_hash)
+            self.hash_cache.move_to_end(key)
+            if self.cache_limit is not None:
+                while len(self.hash_cache) > self.cache_limit:
+                    self.hash_cache.popitem(last=False)
+    
+    def load_cache(self):
+        """从缓存文件加载已计算的哈希，文件缺失或损坏时忽略"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # 其他算法计算的缓存不能复用
+            if data.get("algorithm") != self.algorithm:
+                return
+            for path, (identity, md5_hash) in data["files"].items():
+                self._cache_hash(path, tuple(identity), md5_hash)
+        except Exception:
+            pass
+    
+    def save_cache(self):
+        """保存哈希缓存，下次验证未改动的文件时无需重新读取"""
+        if not self.cache_file:
+            return
+        try:
+            with self._cache_lock:
+                files = dict(self.hash_cache)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({"algorithm": self.algorithm, "files": files}, f)
+        except Exception as e:
+            print(f"保存哈希缓存失败: {str(e)}")
         
-    def calculate_md5(self, file_path: str, chunk_size: int = 8192) -> str:
+    def _new_hash(self):
+        """按algorithm创建哈希对象"""
+        if self.algorithm == "blake3":
+            if blake3 is None:
+                raise ValueError("使用blake3需要先安装: pip install blake3")
+            # BLAKE3为树形结构，单个文件也可以多线程计算
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.new(self.algorithm)
+    
+    def calculate_md5(self, file_path: str, chunk_size: int = 1024 * 1024, stat: Optional[os.stat_result] = None,
+                      use_cache: bool = True) -> str:
         """
-        计算文件的MD5值
+        计算文件的哈希值（默认MD5，由algorithm指定）
         
         Args:
             file_path: 文件路径
             chunk_size: 分块大小
+            stat: 调用方已获取的文件状态（可选，省去一次stat）
+            use_cache: 是否复用缓存的哈希值；为False时总是读取文件（结果仍写入缓存）
             
         Returns:
-            MD5哈希值
+            哈希值
         """
-        md5_hash = hashlib.md5()
+        md5_hash = self._new_hash()
         try:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(chunk_size):
-                    md5_hash.update(chunk)
-            return md5_hash.hexdigest()
+            key = os.path.abspath(file_path)
+            if stat is None:
+                stat = os.stat(key)
+            identity = _stat_identity(stat)
+            cached = self._cached_hash(key) if use_cache else None
+            if cached and cached[0] == identity:
+                return cached[1]
+            if self.algorithm == "md5" and _MD5SUM and stat.st_size > self.external_md5_threshold:
+                result = _external_md5(file_path)
+                if result is not None:
+                    self._cache_hash(key, identity, result)
+                    return result
+            with open(os.open(file_path, _SEQUENTIAL_READ_FLAGS), "rb", buffering=0) as f:
+                try:
+                    # 读完后释放页缓存，避免验证大量文件时挤掉其他程序的缓存
+                    if stat.st_size < chunk_size:
+                        # 小文件一次读完，只调用一次update，预读提示对单次读取没有意义，省去这次系统调用
+                        md5_hash.update(f.read())
+                    else:
+                        # 顺序读取加大预读窗口
+                        _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+                        # 缓冲区反复读入，不经过额外的缓冲层，也不逐块创建bytes对象；hashlib计算时释放GIL
+                        # 不使用mmap：映射读取时介质被拔出或文件被截断会触发SIGBUS使整个进程退出，read则只抛出OSError
+                        buffer = bytearray(chunk_size)
+                        view = memoryview(buffer)
+                        while read_size := f.readinto(buffer):
+                            md5_hash.update(view[:read_size])
+                finally:
+                    _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+            result = md5_hash.hexdigest()
+            self._cache_hash(key, identity, result)
+            return result
         except Exception as e:
             raise Exception(f"计算MD5失败 {file_path}: {str(e)}")
     
+    def calculate_md5_batch(self, paths: List[str], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        同时计算多个文件的哈希值
+        
+        Args:
+            paths: 文件路径列表
+            max_workers: 同时计算的文件数（默认按CPU核心数，最多8个）
+            
+        Returns:
+            文件路径到哈希值的映射字典，计算失败的文件不包含在内
+        """
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+        
+        def calculate(group):
+            hashes = {}
+            for path in group:
+                try:
+                    hashes[path] = self.calculate_md5(path)
+                except Exception as e:
+                    print(str(e))
+            return hashes
+        
+        # 按组提交，大量小文件时每组只有一次任务调度开销，而不是每个文件一次
+        group_size = max(1, min(256, len(paths) // (max_workers * 4)))
+        groups = [paths[i:i + group_size] for i in range(0, len(paths), group_size)]
+        
+        # hashlib计算时释放GIL，各组在各自线程中读取和计算
+        hashes = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for group_hashes in executor.map(calculate, groups):
+                hashes.update(group_hashes)
+        return hashes
+    
+    def _calculate_md5_pipelined(self, pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        源文件和目标文件分别在各自的线程池中计算哈希，两个磁盘同时读取
+        
+        Args:
+            pairs: (源文件, 目标文件) 列表
+            
+        Returns:
+            文件路径到哈希值的映射字典，计算失败的文件不包含在内
+        """
+        def calculate(path, use_cache):
+            try:
+                return self.calculate_md5(path, use_cache=use_cache)
+            except Exception as e:
+                print(str(e))
+                return None
+        
+        # 目标文件总是重新读取，验证的是介质上的实际内容；源文件可复用缓存
+        # 每侧的读取按顺序排队，源盘和目标盘的队列互不等待，hashlib释放GIL使两侧真正并行
+        with ThreadPoolExecutor(max_workers=self.verify_side_workers) as source_pool, \
+                ThreadPoolExecutor(max_workers=self.verify_side_workers) as dest_pool:
+            futures = [(source_file, source_pool.submit(calculate, source_file, True),
+                        dest_file, dest_pool.submit(calculate, dest_file, False))
+                       for source_file, dest_file in pairs]
+            hashes = {}
+            for source_file, source_future, dest_file, dest_future in futures:
+                for path, future in ((source_file, source_future), (dest_file, dest_future)):
+                    md5_hash = future.result()
+                    if md5_hash is not None:
+                        hashes[path] = md5_hash
+            return hashes
+    
     def verify_file(self, source_path: str, dest_path: str) -> Tuple[bool, str]:
         """
         验证两个文件是否相同
@@ -47,52 +299,107 @@ class MD5Verifier:
             (是否相同, 错误信息)
         """
         try:
-            source_md5 = self.calculate_md5(source_path)
-            dest_md5 = self.calculate_md5(dest_path)
+            source_key = os.path.abspath(source_path)
+            dest_key = os.path.abspath(dest_path)
+            source_stat = os.stat(source_key)
+            dest_stat = os.stat(dest_key)
             
-            if source_md5 == dest_md5:
-                return True, ""
-            else:
-                return False, f"MD5不匹配: 源={source_md5}, 目标={dest_md5}"
+            # 大小不同则内容不可能相同，无需读取
+            if source_stat.st_size != dest_stat.st_size:
+                return False, f"大小不一致: 源={source_stat.st_size}, 目标={dest_stat.st_size}"
+            
+            # 源文件哈希已缓存时只需读取目标文件；目标文件总是重新读取，不信任缓存
+            source_identity = _stat_identity(source_stat)
+            dest_identity = _stat_identity(dest_stat)
+            source_cached = self._cached_hash(source_key)
+            if source_cached and source_cached[0] == source_identity:
+                dest_md5 = self.calculate_md5(dest_key, stat=dest_stat, use_cache=False)
+                return self._compare_hashes(source_cached[1], dest_md5)
+            
+            # 同时读取两个文件逐块比较，遇到不同立即返回；内容相同时哈希也相同，只需计算一次
+            chunk_size = 1024 * 1024
+            md5_hash = self._new_hash()
+            source_buffer = bytearray(chunk_size)
+            dest_buffer = bytearray(chunk_size)
+            source_view = memoryview(source_buffer)
+            dest_view = memoryview(dest_buffer)
+            offset = 0
+            with open(os.open(source_key, _SEQUENTIAL_READ_FLAGS), "rb", buffering=0) as src, \
+                    open(os.open(dest_key, _SEQUENTIAL_READ_FLAGS), "rb", buffering=0) as dst:
+                try:
+                    _fadvise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+                    _fadvise(dst.fileno(), "POSIX_FADV_SEQUENTIAL")
+                    while True:
+                        read_size = _readinto_full(src, source_view)
+                        if _readinto_full(dst, dest_view) != read_size:
+                            return False, f"内容不一致: 文件长度不同（偏移 {offset + read_size} 处）"
+                        # 整块时直接比较bytearray（memcmp），只有最后一块需要切片
+                        if read_size == chunk_size:
+                            same = source_buffer == dest_buffer
+                        else:
+                            same = source_buffer[:read_size] == dest_buffer[:read_size]
+                        if not same:
+                            return False, f"内容不一致: 偏移 {offset} 起的数据块不同"
+                        if not read_size:
+                            break
+                        md5_hash.update(source_view[:read_size])
+                        offset += read_size
+                finally:
+                    _fadvise(src.fileno(), "POSIX_FADV_DONTNEED")
+                    _fadvise(dst.fileno(), "POSIX_FADV_DONTNEED")
+            
+            result = md5_hash.hexdigest()
+            self._cache_hash(source_key, source_identity, result)
+            self._cache_hash(dest_key, dest_identity, result)
+            return True, ""
                 
         except Exception as e:
             return False, f"验证失败: {str(e)}"
     
+    def _compare_hashes(self, source_md5: str, dest_md5: str) -> Tuple[bool, str]:
+        """比较源文件和目标文件的哈希值，返回(是否相同, 错误信息)"""
+        if source_md5 == dest_md5:
+            return True, ""
+        return False, f"{self.algorithm.upper()}不匹配: 源={source_md5}, 目标={dest_md5}"
+    
     def create_checksum_file(self, folder_path: str, output_file: str = None) -> str:
         """
         为文件夹创建校验和文件
         
         Args:
             folder_path: 文件夹路径
-            output_file: 输出文件路径（可选）
+            output_file: 输出文件路径（可选，默认为文件夹下按算法命名的校验和文件）
             
         Returns:
             校验和文件路径
         """
         if output_file is None:
-            output_file = os.path.join(folder_path, "checksums.md5")
+            output_file = os.path.join(folder_path, self.checksum_file_name)
             
-        checksums = {}
+        output_key = os.path.abspath(output_file)
         
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file == "checksums.md5":  # 跳过已有的校验和文件
-                    continue
-                    
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, folder_path)
-                
-                try:
-                    md5_hash = self.calculate_md5(file_path)
-                    checksums[rel_path] = md5_hash
-                except Exception as e:
-                    print(f"计算MD5失败 {file_path}: {str(e)}")
-                    
-        # 保存校验和文件
+        def write_batch(f, batch):
+            """并行计算一批文件的哈希并按遍历顺序写出"""
+            hashes = self.calculate_md5_batch([file_path for _, file_path in batch])
+            # 整批拼接后一次编码写出，不经过文本模式逐行编码
+            f.write("".join(
+                f"{hashes[file_path]}  {rel_path}\n"
+                for rel_path, file_path in batch if file_path in hashes
+            ).encode('utf-8'))
+        
+        # 边遍历边按批计算并写出，不在内存中保留整棵目录树的路径和哈希
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for rel_path, md5_hash in checksums.items():
-                    f.write(f"{md5_hash}  {rel_path}\n")
+            with open(output_file, 'wb', buffering=1024 * 1024) as f:
+                batch = []
+                for file_path, rel_path in _iter_files(folder_path):
+                    # 跳过已有的校验和文件和正在写入的输出文件
+                    if os.path.basename(file_path) == self.checksum_file_name or os.path.abspath(file_path) == output_key:
+                        continue
+                    batch.append((rel_path, file_path))
+                    if len(batch) >= self.checksum_batch_size:
+                        write_batch(f, batch)
+                        batch.clear()
+                write_batch(f, batch)
             return output_file
         except Exception as e:
             raise Exception(f"保存校验和文件失败: {str(e)}")
@@ -107,16 +414,24 @@ class MD5Verifier:
         Returns:
             文件路径到MD5的映射字典
         """
-        checksums = {}
-        
         try:
-            with open(checksum_file, 'r', encoding='utf-8') as f:
+            # 校验和文件通常不大，整体读入后一次切分行，省去逐行读取的开销；超大文件仍按行流式解析
+            # 两种方式都只以\n分行并去掉行尾的\r（文件名中可以含有splitlines也会切分的其他换行字符）
+            if os.path.getsize(checksum_file) <= self.checksum_read_limit:
+                with open(checksum_file, 'r', encoding='utf-8', newline='\n') as f:
+                    lines = f.read().split('\n')
+                return {file_path: md5_hash
+                        for line in (raw.rstrip('\r') for raw in lines) if line and not line.startswith('#')
+                        for md5_hash, _, file_path in (line.partition('  '),)  # 使用两个空格分隔
+                        if file_path}
+            
+            checksums = {}
+            with open(checksum_file, 'r', encoding='utf-8', newline='\n') as f:
                 for line in f:
-                    line = line.strip()
+                    line = line.rstrip('\n').rstrip('\r')
                     if line and not line.startswith('#'):
-                        parts = line.split('  ', 1)  # 使用两个空格分隔
-                        if len(parts) == 2:
-                            md5_hash, file_path = parts
+                        md5_hash, _, file_path = line.partition('  ')
+                        if file_path:
                             checksums[file_path] = md5_hash
                             
         except Exception as e:
@@ -124,7 +439,7 @@ class MD5Verifier:
             
         return checksums
     
-    def verify_folder(self, source_folder: str, dest_folder: str, create_checksums: bool = True) -> Dict[str, Tuple[bool, str]]:
+    def verify_folder(self, source_folder: str, dest_folder: str, create_checksums: bool = True, quick: bool = False) -> Dict[str, Tuple[bool, str]]:
         """
         验证两个文件夹是否相同
         
@@ -132,12 +447,11 @@ class MD5Verifier:
             source_folder: 源文件夹
             dest_folder: 目标文件夹
             create_checksums: 是否创建校验和文件
+            quick: 大小和修改时间（秒）都相同时视为一致，不计算哈希（类似rsync的快速检查）
             
         Returns:
             验证结果字典
         """
-        results = {}
-        
         # 为源文件夹创建校验和文件
         if create_checksums:
             try:
@@ -146,28 +460,53 @@ class MD5Verifier:
             except Exception as e:
                 print(f"创建源文件夹校验和文件失败: {str(e)}")
                 
-        # 获取源文件夹的所有文件
-        source_files = {}
-        for root, dirs, files in os.walk(source_folder):
-            for file in files:
-                if file == "checksums.md5":
-                    continue
-                    
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, source_folder)
-                source_files[rel_path] = file_path
-        
-        # 验证每个文件
+        # 获取源文件夹的所有文件（按文件名排除校验和文件；Windows盘符根目录下的路径以"/"分隔，不能按分隔符后缀判断）
+        source_files = {rel_path: file_path for file_path, rel_path in _iter_files(source_folder)
+                        if os.path.basename(file_path) != self.checksum_file_name}
+        
+        # 先按文件状态判断：目标缺失或大小不同直接判定，其余文件对交给源、目标两侧并行计算哈希
+        dest_prefix = os.path.join(dest_folder, "")
+        dest_files = {}
+        stat_results = {}
         for rel_path, source_file in source_files.items():
-            dest_file = os.path.join(dest_folder, rel_path)
-            
-            if not os.path.exists(dest_file):
-                results[rel_path] = (False, "目标文件不存在")
+            dest_file = dest_prefix + rel_path
+            try:
+                dest_stat = os.stat(dest_file)
+            except OSError:
+                stat_results[rel_path] = (False, "目标文件不存在")
+                continue
+            try:
+                source_stat = os.stat(source_file)
+            except OSError:
+                # 源文件无法读取时交给哈希计算报告错误
+                dest_files[rel_path] = dest_file
+                continue
+            if source_stat.st_size != dest_stat.st_size:
+                stat_results[rel_path] = (False, f"大小不一致: 源={source_stat.st_size}, 目标={dest_stat.st_size}")
+            elif quick and int(source_stat.st_mtime) == int(dest_stat.st_mtime):
+                stat_results[rel_path] = (True, "")
+            else:
+                dest_files[rel_path] = dest_file
+        hashes = self._calculate_md5_pipelined(
+            [(source_files[rel_path], dest_file) for rel_path, dest_file in dest_files.items()]
+        )
+        
+        # 验证每个文件（按源文件顺序输出结果）
+        results = {}
+        for rel_path, source_file in source_files.items():
+            stat_result = stat_results.get(rel_path)
+            if stat_result is not None:
+                results[rel_path] = stat_result
                 continue
                 
-            is_valid, error_msg = self.verify_file(source_file, dest_file)
-            results[rel_path] = (is_valid, error_msg)
+            source_md5 = hashes.get(source_file)
+            dest_md5 = hashes.get(dest_files[rel_path])
+            if source_md5 is None or dest_md5 is None:
+                results[rel_path] = (False, "验证失败: 无法计算哈希值")
+            else:
+                results[rel_path] = self._compare_hashes(source_md5, dest_md5)
             
+        self.save_cache()
         return results
     
     def get_file_info(self, file_path: str) -> Dict[str, any]:
@@ -185,7 +524,7 @@ class MD5Verifier:
             return {
                 'size': stat.st_size,
                 'modified': stat.st_mtime,
-                'md5': self.calculate_md5(file_path)
+                'md5': self.calculate_md5(file_path, stat=stat)
             }
         except Exception as e:
             raise Exception(f"获取文件信息失败: {str(e)}")
@@ -220,8 +559,8 @@ def test_md5_verifier():
         # 清理测试文件
         if os.path.exists(test_file):
             os.remove(test_file)
-        if os.path.exists("checksums.md5"):
-            os.remove("checksums.md5")
+        if os.path.exists(verifier.checksum_file_name):
+            os.remove(verifier.checksum_file_name)
 
 if __name__ == "__main__":
     test_md5_verifier()
\ No newline at end of file